@@ -5,6 +5,7 @@ Script de démarrage pour l'exécutable Publipostage DOETH.
 Ce script sert de point d'entrée pour PyInstaller.
 """
 
+import multiprocessing
 import os
 import sys
 from pathlib import Path
@@ -17,6 +18,8 @@ sys.path.insert(0, app_path)
 from gui import main
 
 if __name__ == "__main__":
+    # Requis par multiprocessing dans l'exécutable figé (génération parallèle)
+    multiprocessing.freeze_support()
     # Définir le répertoire de travail sur celui de l'exécutable
     if getattr(sys, 'frozen', False):
         os.chdir(os.path.dirname(sys.executable))
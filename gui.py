@@ -6,79 +6,251 @@ L'IHM a été optimisée pour une expérience utilisateur optimale : responsive,
 palette de couleurs fonctionnelles et indicateurs de progression clairs.
 """
 
+import argparse
 import os
 import sys
 import threading
+import time
 import subprocess
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 import queue
 import logging
+import logging.handlers
+import collections
+import gc
+import types
+from functools import lru_cache, partial
+
+# Les modules du projet (pandas, python-docx...) sont importés à la demande :
+# seul Tkinter est chargé avant l'affichage de la fenêtre.
+_LAZY_IMPORTS = {
+    "OutputFormat": "src.document_generator",
+    "generer_attestations_doeth": "src.document_generator",
+    "nettoyer_fichier_excel": "src.data_processor",
+}
+
+
+# Modules préchargés en arrière-plan après l'affichage de la fenêtre
+_PREWARM_MODULES = ("pandas", "openpyxl", "docx", "src.data_processor",
+                    "src.document_generator", "main")
+
+
+def __getattr__(name):
+    """Résout paresseusement les anciens noms exportés par ce module."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    return getattr(importlib.import_module(module_name), name)
+
+
+@lru_cache(maxsize=64)
+def _stat(path):
+    """
+    Retourne le résultat de os.stat pour un chemin, ou None s'il n'existe pas.
+
+    Le résultat est mémorisé ; le cache est vidé à chaque modification d'un
+    chemin dans l'interface et au lancement d'un traitement.
+    """
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
 
-# Importer les modules du projet
-from src.utils.config import get, Config
-from src.utils.logger import setup_logger, get_logger
-from src.data_processor import nettoyer_fichier_excel
-from src.document_generator import generer_attestations_doeth
 
+def _exists(path):
+    """Teste l'existence d'un fichier à partir du cache de _stat."""
+    return _stat(path) is not None
 
-class RedirectText:
-    """Redirige les logs vers un widget Text avec file d'attente."""
 
-    def __init__(self, text_widget):
-        self.text_widget = text_widget
-        self.queue = queue.Queue()
-        self.update_timer = None
+def _clear_exists_cache(*_):
+    """Callback de trace Tk : invalide le cache de _stat."""
+    _stat.cache_clear()
+
 
-    def write(self, string):
-        self.queue.put(string)
-        if self.update_timer is None:
-            self.update_timer = self.text_widget.after(
-                100, self.update_text_widget)
+@lru_cache(maxsize=1)
+def _config_defaults():
+    """Lit en une seule passe les valeurs de configuration utilisées par l'interface."""
+    from src.utils.config import get
+    return {
+        'input_dir': get('paths.input_dir', './data/input'),
+        'input_filename': get('defaults.input_filename', 'donnees.xlsx'),
+        'excel_sheet': get('defaults.excel_sheet', 'Feuil1'),
+        'output_dir': get('paths.output_dir', './data/output'),
+        'logo_path': get('resources.logo_path', ''),
+        'signature_path': get('resources.signature_path', ''),
+    }
 
-    def update_text_widget(self):
-        self.update_timer = None
+
+def _import_modules(module_names):
+    """Importe les modules indiqués en ignorant ceux qui sont indisponibles."""
+    import importlib
+    for module_name in module_names:
         try:
-            while True:
-                string = self.queue.get_nowait()
-                self.text_widget.configure(state="normal")
-                self.text_widget.insert("end", string)
-                self.text_widget.see("end")
-                self.text_widget.configure(state="disabled")
-                self.queue.task_done()
-        except queue.Empty:
+            importlib.import_module(module_name)
+        except Exception:
             pass
 
-    def flush(self):
-        pass
+
+# Ouverture native des dossiers (uniquement disponible sous Windows)
+_STARTFILE = getattr(os, "startfile", None)
+
+# Libellés de pourcentage précalculés pour la barre de progression
+_PERCENT_LABELS = tuple(f"{i}%" for i in range(101))
+
+# Palette de couleurs et paramètres de design
+_BRAND = types.SimpleNamespace(
+    PRIMARY="#1976D2",  # Bleu pour actions d'ouverture
+    START="#388E3C",  # Vert pour démarrer
+    EXIT="#D32F2F",  # Rouge pour quitter
+    BG="#F5F5F5",  # Fond gris très clair
+    TEXT="#212121",  # Texte gris foncé
+)
+
+_BUTTON_FONT = ('Segoe UI', 10, 'bold')
+
+_IMAGE_FILETYPES = [("Images", "*.png *.jpg *.jpeg *.gif *.bmp"),
+                    ("Tous les fichiers", "*.*")]
+
+# Styles ttk : (nom du style, options de configure, options de map)
+_STYLES = (
+    ('TFrame', {'background': _BRAND.BG}, None),
+    ('TLabel', {'background': _BRAND.BG, 'foreground': _BRAND.TEXT,
+                'font': ('Segoe UI', 10)}, None),
+    ('TLabelframe', {'background': _BRAND.BG, 'foreground': _BRAND.TEXT}, None),
+    ('TLabelframe.Label', {'background': _BRAND.BG, 'foreground': _BRAND.PRIMARY,
+                           'font': ('Segoe UI', 11, 'bold')}, None),
+    ('TEntry', {'padding': 5}, None),
+    ('TCheckbutton', {'background': _BRAND.BG, 'foreground': _BRAND.TEXT,
+                      'font': ('Segoe UI', 10)}, None),
+    # Boutons avec styles spécifiques
+    ('Start.TButton', {'background': _BRAND.START, 'foreground': "white",
+                       'font': _BUTTON_FONT, 'padding': 6, 'borderwidth': 0},
+     {'background': [('active', "#66BB6A")]}),
+    ('Open.TButton', {'background': _BRAND.PRIMARY, 'foreground': "white",
+                      'font': _BUTTON_FONT, 'padding': 6, 'borderwidth': 0},
+     {'background': [('active', "#64B5F6")]}),
+    ('Exit.TButton', {'background': _BRAND.EXIT, 'foreground': "white",
+                      'font': _BUTTON_FONT, 'padding': 6, 'borderwidth': 0},
+     {'background': [('active', "#E57373")]}),
+    # Barre de progression personnalisée (vert)
+    ("Green.Horizontal.TProgressbar", {'troughcolor': _BRAND.BG, 'bordercolor': _BRAND.BG,
+                                       'background': "#388E3C", 'lightcolor': "#66BB6A",
+                                       'darkcolor': "#2E7D32"}, None),
+)
+
+
+# Nombre maximal de lignes conservées dans les zones de logs
+_MAX_LOG_LINES = 5000
+
+
+def _trim_text_widget(text_widget, max_lines):
+    """Supprime les plus anciennes lignes d'un widget Text au-delà de max_lines."""
+    line_count = int(text_widget.index("end-1c").split(".")[0])
+    if line_count > max_lines:
+        text_widget.delete("1.0", f"{line_count - max_lines + 1}.0")
+
+
+# Touches conservées dans les zones de logs en lecture seule (navigation, copie)
+_READONLY_KEYS = frozenset(("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End"))
+
+
+def _readonly_key(event):
+    """Bloque les frappes qui modifieraient un widget Text en lecture seule."""
+    if event.keysym in _READONLY_KEYS:
+        return None
+    if event.state & 0x4 and event.keysym.lower() in ("c", "a"):  # Ctrl+C / Ctrl+A
+        return None
+    return "break"
+
+
+def _break_event(event):
+    """Interrompt la propagation d'un événement Tk."""
+    return "break"
 
 
 class LoggingHandler(logging.Handler):
     """Handler personnalisé pour rediriger les logs avec coloration."""
 
-    def __init__(self, text_widget):
+    # Nombre maximal de lignes conservées dans le widget
+    MAX_LINES = _MAX_LOG_LINES
+    # Intervalle minimal entre deux rafraîchissements du widget (~20 Hz)
+    REFRESH_MS = 50
+
+    # Tag de couleur du widget par niveau de log
+    LEVEL_COLORS = {
+        logging.DEBUG: "gray",
+        logging.INFO: "black",
+        logging.WARNING: "orange",
+        logging.ERROR: "red",
+        logging.CRITICAL: "red"
+    }
+
+    def __init__(self, text_widget=None):
         super().__init__()
+        self.text_widget = None
+        self._pending = collections.deque()
+        self._flush_scheduled = False
+        self._closed = False
+        if text_widget is not None:
+            self.attach(text_widget)
+
+    def attach(self, text_widget):
+        """Associe le widget d'affichage et y verse les messages reçus entre-temps."""
         self.text_widget = text_widget
-        self.level_colors = {
-            logging.DEBUG: "gray",
-            logging.INFO: "black",
-            logging.WARNING: "orange",
-            logging.ERROR: "red",
-            logging.CRITICAL: "red"
-        }
+        text_widget.bind("<Destroy>", self._on_destroy, add="+")
+        if self._pending and not self._flush_scheduled:
+            self._flush_scheduled = True
+            text_widget.after_idle(self.update_log)
+
+    def _on_destroy(self, event):
+        self._closed = True
+
+    def close(self):
+        self._closed = True
+        super().close()
 
     def emit(self, record):
+        # Widget détruit (fenêtre fermée pendant un traitement) : rien à afficher
+        if self._closed:
+            return
         msg = self.format(record)
-        level_color = self.level_colors.get(record.levelno, "black")
+        level_color = self.LEVEL_COLORS.get(record.levelno, "black")
+        self._pending.append((msg, level_color))
+        if self.text_widget is None:
+            # Widget pas encore construit : attach() affichera ces messages
+            return
 
-        def update_log():
-            self.text_widget.configure(state="normal")
-            self.text_widget.insert("end", msg + "\n", level_color)
-            self.text_widget.see("end")
-            self.text_widget.configure(state="disabled")
+        # Un seul rafraîchissement programmé pour tous les messages en attente,
+        # au plus toutes les REFRESH_MS quel que soit le débit de logs
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.text_widget.after(self.REFRESH_MS, self.update_log)
+
+    def update_log(self):
+        """Insère d'un bloc tous les messages en attente dans le widget."""
+        self._flush_scheduled = False
+        # Regroupement des messages consécutifs de même couleur : un seul appel
+        # insert pour tout le lot, avec un bloc de texte par couleur.
+        runs = []
+        block, block_color = [], None
+        while self._pending:
+            msg, level_color = self._pending.popleft()
+            if level_color != block_color and block:
+                runs += ("".join(block), block_color)
+                block = []
+            block.append(msg + "\n")
+            block_color = level_color
+        if block:
+            runs += ("".join(block), block_color)
+        if not runs:
+            return
 
-        self.text_widget.after(0, update_log)
+        self.text_widget.insert("end", *runs)
+        _trim_text_widget(self.text_widget, self.MAX_LINES)
+        self.text_widget.see("end")
 
 
 class PublipostageGUI:
@@ -88,74 +260,74 @@ class PublipostageGUI:
         self.root = root
         root.title("Publipostage DOETH")
 
-        # Palette de couleurs et paramètres de design
-        self.primary_color = "#1976D2"  # Bleu pour actions d'ouverture
-        self.start_color = "#388E3C"  # Vert pour démarrer
-        self.exit_color = "#D32F2F"  # Rouge pour quitter
-        self.bg_color = "#F5F5F5"  # Fond gris très clair
-        self.text_color = "#212121"  # Texte gris foncé
-
-        # Configuration du thème et styles
-        style = ttk.Style()
-        if 'clam' in style.theme_names():
-            style.theme_use('clam')
-
-        style.configure('TFrame', background=self.bg_color)
-        style.configure('TLabel', background=self.bg_color,
-                        foreground=self.text_color, font=('Segoe UI', 10))
-        style.configure('TLabelframe', background=self.bg_color,
-                        foreground=self.text_color)
-        style.configure('TLabelframe.Label', background=self.bg_color, foreground=self.primary_color,
-                        font=('Segoe UI', 11, 'bold'))
-        style.configure('TEntry', padding=5)
-        style.configure('TCheckbutton', background=self.bg_color,
-                        foreground=self.text_color, font=('Segoe UI', 10))
-
-        # Boutons avec styles spécifiques
-        style.configure('Start.TButton', background=self.start_color, foreground="white", font=('Segoe UI', 10, 'bold'),
-                        padding=6, borderwidth=0)
-        style.map('Start.TButton', background=[('active', "#66BB6A")])
-        style.configure('Open.TButton', background=self.primary_color, foreground="white",
-                        font=('Segoe UI', 10, 'bold'), padding=6, borderwidth=0)
-        style.map('Open.TButton', background=[('active', "#64B5F6")])
-        style.configure('Exit.TButton', background=self.exit_color, foreground="white", font=('Segoe UI', 10, 'bold'),
-                        padding=6, borderwidth=0)
-        style.map('Exit.TButton', background=[('active', "#E57373")])
-
-        # Barre de progression personnalisée (vert)
-        style.configure("Green.Horizontal.TProgressbar", troughcolor=self.bg_color, bordercolor=self.bg_color,
-                        background="#388E3C", lightcolor="#66BB6A", darkcolor="#2E7D32")
+        self.apply_theme()
 
         # Configuration de la fenêtre
         root.geometry("900x700")
         root.minsize(700, 500)
-        root.configure(background=self.bg_color)
+        root.configure(background=_BRAND.BG)
 
         # Variables pour les paramètres
+        defaults = _config_defaults()
         self.input_file_var = tk.StringVar(value=os.path.join(
-            get('paths.input_dir', './data/input'),
-            get('defaults.input_filename', 'donnees.xlsx')
-        ))
-        self.sheet_name_var = tk.StringVar(
-            value=get('defaults.excel_sheet', 'Feuil1'))
-        self.output_dir_var = tk.StringVar(
-            value=get('paths.output_dir', './data/output'))
+            defaults['input_dir'], defaults['input_filename']))
+        self.sheet_name_var = tk.StringVar(value=defaults['excel_sheet'])
+        self.output_dir_var = tk.StringVar(value=defaults['output_dir'])
         self.csv_path_var = tk.StringVar()
-        self.logo_path_var = tk.StringVar(value=get('resources.logo_path', ''))
-        self.signature_path_var = tk.StringVar(
-            value=get('resources.signature_path', ''))
+        self.logo_path_var = tk.StringVar(value=defaults['logo_path'])
+        self.signature_path_var = tk.StringVar(value=defaults['signature_path'])
         self.skip_processing_var = tk.BooleanVar(value=False)
         self.debug_var = tk.BooleanVar(value=False)
         self.output_format_var = tk.StringVar(value="docx")
 
+        # Toute modification d'un chemin invalide le cache des tests d'existence
+        for var in (self.input_file_var, self.csv_path_var,
+                    self.logo_path_var, self.signature_path_var):
+            var.trace_add("write", _clear_exists_cache)
+
         # Etat de traitement
         self.processing = False
         self.process_thread = None
+        self._prewarm_thread = None
+
+        # Mise à jour différée et fusionnée de la progression
+        self._pending_progress = None
+        self._progress_scheduled = False
+        self._last_progress = 0
+        self._last_status = None
+        self._last_progress_ts = 0.0
+        self._last_pct = None
 
         self.create_widgets()
         self.setup_logging()
         root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Préchargement des modules lourds une fois la fenêtre affichée
+        root.after(50, self._prewarm)
+
+    def _prewarm(self):
+        """Importe en arrière-plan les modules du traitement pour accélérer le premier lancement."""
+        if self._prewarm_thread is not None or self.processing:
+            return
+
+        self._prewarm_thread = threading.Thread(
+            target=_import_modules, args=(_PREWARM_MODULES,), daemon=True)
+        self._prewarm_thread.start()
+
+    def apply_theme(self):
+        """Configure le thème et les styles ttk (une seule fois par interpréteur Tk)."""
+        # Les styles ttk sont propres à l'interpréteur Tcl, donc à la fenêtre racine
+        if getattr(self.root, "_theme_applied", False):
+            return
+        style = ttk.Style(self.root)
+        if 'clam' in style.theme_names():
+            style.theme_use('clam')
+        for name, options, state_map in _STYLES:
+            style.configure(name, **options)
+            if state_map:
+                style.map(name, **state_map)
+        self.root._theme_applied = True
+
     def create_widgets(self):
         """Création et organisation des widgets avec un design responsive et coloré."""
         main_frame = ttk.Frame(self.root, padding="20", style="TFrame")
@@ -189,8 +361,9 @@ class PublipostageGUI:
             row=0, column=0, sticky="w", padx=5, pady=5)
         input_entry = ttk.Entry(params_frame, textvariable=self.input_file_var)
         input_entry.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
-        ttk.Button(params_frame, text="Parcourir...", command=self.browse_input_file).grid(row=0, column=2, padx=5,
-                                                                                           pady=5)
+        ttk.Button(params_frame, text="Parcourir...", command=self.make_browse_command(
+            self.input_file_var, "Sélectionner le fichier Excel",
+            [("Fichiers Excel", "*.xlsx *.xls"), ("Tous les fichiers", "*.*")])).grid(row=0, column=2, padx=5, pady=5)
 
         ttk.Label(params_frame, text="Feuille Excel:").grid(
             row=1, column=0, sticky="w", padx=5, pady=5)
@@ -205,8 +378,8 @@ class PublipostageGUI:
         output_entry = ttk.Entry(
             params_frame, textvariable=self.output_dir_var)
         output_entry.grid(row=2, column=1, sticky="ew", padx=5, pady=5)
-        ttk.Button(params_frame, text="Parcourir...", command=self.browse_output_dir).grid(row=2, column=2, padx=5,
-                                                                                           pady=5)
+        ttk.Button(params_frame, text="Parcourir...", command=self.make_browse_command(
+            self.output_dir_var, "Sélectionner le dossier de sortie", directory=True)).grid(row=2, column=2, padx=5, pady=5)
 
         # Paramètres Logo et Signature
         resources_frame = ttk.LabelFrame(params_frame, text="Ressources des attestations", padding="15",
@@ -220,16 +393,18 @@ class PublipostageGUI:
         logo_entry = ttk.Entry(
             resources_frame, textvariable=self.logo_path_var)
         logo_entry.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
-        ttk.Button(resources_frame, text="Parcourir...", command=self.browse_logo_file).grid(row=0, column=2, padx=5,
-                                                                                             pady=5)
+        ttk.Button(resources_frame, text="Parcourir...", command=self.make_browse_command(
+            self.logo_path_var, "Sélectionner le logo", _IMAGE_FILETYPES,
+            log_label="Logo sélectionné")).grid(row=0, column=2, padx=5, pady=5)
 
         ttk.Label(resources_frame, text="Signature:").grid(
             row=1, column=0, sticky="w", padx=5, pady=5)
         signature_entry = ttk.Entry(
             resources_frame, textvariable=self.signature_path_var)
         signature_entry.grid(row=1, column=1, sticky="ew", padx=5, pady=5)
-        ttk.Button(resources_frame, text="Parcourir...", command=self.browse_signature_file).grid(row=1, column=2,
-                                                                                                  padx=5, pady=5)
+        ttk.Button(resources_frame, text="Parcourir...", command=self.make_browse_command(
+            self.signature_path_var, "Sélectionner la signature", _IMAGE_FILETYPES,
+            log_label="Signature sélectionnée")).grid(row=1, column=2, padx=5, pady=5)
 
         # Options avancées
         advanced_frame = ttk.LabelFrame(
@@ -245,8 +420,10 @@ class PublipostageGUI:
         self.csv_entry = ttk.Entry(
             advanced_frame, textvariable=self.csv_path_var, state="disabled")
         self.csv_entry.grid(row=1, column=1, sticky="ew", padx=5, pady=5)
-        self.csv_button = ttk.Button(advanced_frame, text="Parcourir...", command=self.browse_csv_file,
-                                     state="disabled")
+        self.csv_button = ttk.Button(advanced_frame, text="Parcourir...", command=self.make_browse_command(
+            self.csv_path_var, "Sélectionner le fichier CSV",
+            [("Fichiers CSV", "*.csv"), ("Parquet / Feather", "*.parquet *.feather"),
+             ("Tous les fichiers", "*.*")]), state="disabled")
         self.csv_button.grid(row=1, column=2, padx=5, pady=5)
         ttk.Checkbutton(advanced_frame, text="Mode debug (logs détaillés)", variable=self.debug_var) \
             .grid(row=2, column=0, columnspan=2, sticky="w", pady=5)
@@ -267,18 +444,10 @@ class PublipostageGUI:
         main_frame.rowconfigure(4, weight=1)
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
-        self.log_text = tk.Text(log_frame, wrap=tk.WORD,
-                                font=('Consolas', 9), bg="white")
-        self.log_text.grid(row=0, column=0, sticky="nsew")
-        self.log_text.tag_configure("gray", foreground="#707070")
-        self.log_text.tag_configure("black", foreground="#000000")
-        self.log_text.tag_configure("orange", foreground="#FF8C00")
-        self.log_text.tag_configure("red", foreground="#FF0000")
-        self.log_text.configure(state="disabled")
-        log_scrollbar = ttk.Scrollbar(
-            log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
-        log_scrollbar.grid(row=0, column=1, sticky="ns")
-        self.log_text.configure(yscrollcommand=log_scrollbar.set)
+        # Le widget Text est construit après le premier affichage de la fenêtre
+        self.log_frame = log_frame
+        self.log_text = None
+        self.root.after_idle(self.build_log_widgets)
 
         # Barre d'état et de progression
         status_frame = ttk.Frame(main_frame, style="TFrame")
@@ -293,49 +462,102 @@ class PublipostageGUI:
         status_frame.columnconfigure(1, weight=1)
         # Label pour afficher le pourcentage sur la jauge
         self.progress_percentage = ttk.Label(
-            status_frame, text="0%", font=("Segoe UI", 10), background=self.bg_color)
+            status_frame, text="0%", font=("Segoe UI", 10), background=_BRAND.BG)
         self.progress_percentage.grid(row=0, column=2, padx=5)
 
         # Boutons d'action (responsive)
         buttons_frame = ttk.Frame(main_frame, style="TFrame")
         buttons_frame.grid(row=6, column=0, sticky="ew", pady=10)
         buttons_frame.columnconfigure((0, 1, 2), weight=1)
-        ttk.Button(buttons_frame, text="Démarrer le traitement", command=self.start_processing, style="Start.TButton") \
-            .grid(row=0, column=0, padx=10, sticky="ew")
-        ttk.Button(buttons_frame, text="Ouvrir dossier de sortie", command=self.open_output_folder,
-                   style="Open.TButton") \
-            .grid(row=0, column=1, padx=10, sticky="ew")
+        self.start_button = ttk.Button(buttons_frame, text="Démarrer le traitement", command=self.start_processing,
+                                       style="Start.TButton")
+        self.start_button.grid(row=0, column=0, padx=10, sticky="ew")
+        self.open_button = ttk.Button(buttons_frame, text="Ouvrir dossier de sortie", command=self.open_output_folder,
+                                      style="Open.TButton")
+        self.open_button.grid(row=0, column=1, padx=10, sticky="ew")
         ttk.Button(buttons_frame, text="Quitter", command=self.on_closing, style="Exit.TButton") \
             .grid(row=0, column=2, padx=10, sticky="ew")
 
+    def build_log_widgets(self):
+        """Construit la zone de texte des logs et la branche sur le handler."""
+        self.log_text = tk.Text(self.log_frame, wrap=tk.WORD,
+                                font=('Consolas', 9), bg="white")
+        self.log_text.grid(row=0, column=0, sticky="nsew")
+        self.log_text.tag_configure("gray", foreground="#707070")
+        self.log_text.tag_configure("black", foreground="#000000")
+        self.log_text.tag_configure("orange", foreground="#FF8C00")
+        self.log_text.tag_configure("red", foreground="#FF0000")
+        # Lecture seule sans basculer l'état du widget à chaque insertion
+        self.log_text.bindtags((str(self.log_text), "ReadOnlyText", "Text", ".", "all"))
+        self.log_text.bind_class("ReadOnlyText", "<Key>", _readonly_key)
+        for sequence in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<Button-2>"):
+            self.log_text.bind_class("ReadOnlyText", sequence, _break_event)
+        log_scrollbar = ttk.Scrollbar(
+            self.log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
+        log_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.log_text.configure(yscrollcommand=log_scrollbar.set)
+        self.text_handler.attach(self.log_text)
+
     def setup_logging(self):
         """Configure le logging pour rediriger vers le widget Text."""
-        text_handler = LoggingHandler(self.log_text)
-        text_handler.setLevel(logging.DEBUG)
+        text_handler = LoggingHandler()
+        # Les messages DEBUG ne sont formatés que si le mode debug est coché
+        text_handler.setLevel(logging.INFO)
         formatter = logging.Formatter(
             '%(asctime)s | %(levelname)-8s | %(message)s', '%H:%M:%S')
         text_handler.setFormatter(formatter)
+        self.text_handler = text_handler
+
+        # Les threads de traitement se contentent d'empiler les enregistrements ;
+        # la boucle Tk vide la file périodiquement et les transmet au handler du
+        # widget : seul le thread de l'interface touche aux widgets.
+        self.log_queue = queue.SimpleQueue()
+        self.queue_handler = logging.handlers.QueueHandler(self.log_queue)
+        self.queue_handler.setLevel(logging.INFO)
+        self._log_poll_id = None
+        self.debug_var.trace_add("write", self.on_debug_toggle)
+
+        # Remplacement en une seule affectation des handlers existants
         root_logger = logging.getLogger()
+        for handler in root_logger.handlers:
+            handler.close()
+        root_logger.handlers = [self.queue_handler]
         root_logger.setLevel(logging.DEBUG)
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
-        root_logger.addHandler(text_handler)
         self.logger = logging.getLogger("publipostage_gui")
+        self._poll_log_queue()
         self.logger.info("Interface graphique démarrée")
 
         # Vérification des ressources
         logo_path = self.logo_path_var.get()
         signature_path = self.signature_path_var.get()
 
-        if not os.path.exists(logo_path):
-            self.logger.warning(f"Logo non trouvé: {logo_path}")
+        if not _exists(logo_path):
+            self.logger.warning("Logo non trouvé: %s", logo_path)
         else:
-            self.logger.info(f"Logo trouvé: {logo_path}")
+            self.logger.info("Logo trouvé: %s", logo_path)
 
-        if not os.path.exists(signature_path):
-            self.logger.warning(f"Signature non trouvée: {signature_path}")
+        if not _exists(signature_path):
+            self.logger.warning("Signature non trouvée: %s", signature_path)
         else:
-            self.logger.info(f"Signature trouvée: {signature_path}")
+            self.logger.info("Signature trouvée: %s", signature_path)
+
+    def _poll_log_queue(self):
+        """Transmet au handler du widget les enregistrements en attente (thread Tk)."""
+        handler = self.text_handler
+        try:
+            while True:
+                record = self.log_queue.get_nowait()
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+        except queue.Empty:
+            pass
+        self._log_poll_id = self.root.after(LoggingHandler.REFRESH_MS, self._poll_log_queue)
+
+    def on_debug_toggle(self, *_):
+        """Ajuste le niveau des handlers du widget selon la case « Mode debug »."""
+        level = logging.DEBUG if self.debug_var.get() else logging.INFO
+        self.queue_handler.setLevel(level)
+        self.text_handler.setLevel(level)
 
     def toggle_csv_path(self):
         """Active ou désactive les champs relatifs au fichier CSV."""
@@ -346,50 +568,28 @@ class PublipostageGUI:
             self.csv_entry.configure(state="disabled")
             self.csv_button.configure(state="disabled")
 
-    def browse_input_file(self):
-        filepath = filedialog.askopenfilename(
-            title="Sélectionner le fichier Excel",
-            filetypes=[("Fichiers Excel", "*.xlsx *.xls"),
-                       ("Tous les fichiers", "*.*")]
-        )
-        if filepath:
-            self.input_file_var.set(filepath)
-
-    def browse_output_dir(self):
-        dirpath = filedialog.askdirectory(
-            title="Sélectionner le dossier de sortie")
-        if dirpath:
-            self.output_dir_var.set(dirpath)
-
-    def browse_csv_file(self):
-        filepath = filedialog.askopenfilename(
-            title="Sélectionner le fichier CSV",
-            filetypes=[("Fichiers CSV", "*.csv"), ("Tous les fichiers", "*.*")]
-        )
-        if filepath:
-            self.csv_path_var.set(filepath)
-
-    def browse_logo_file(self):
-        filepath = filedialog.askopenfilename(
-            title="Sélectionner le logo",
-            filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.bmp"),
-                       ("Tous les fichiers", "*.*")]
-        )
-        if filepath:
-            self.logo_path_var.set(filepath)
-            if os.path.exists(filepath):
-                self.logger.info(f"Logo sélectionné: {filepath}")
-
-    def browse_signature_file(self):
-        filepath = filedialog.askopenfilename(
-            title="Sélectionner la signature",
-            filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.bmp"),
-                       ("Tous les fichiers", "*.*")]
-        )
-        if filepath:
-            self.signature_path_var.set(filepath)
-            if os.path.exists(filepath):
-                self.logger.info(f"Signature sélectionnée: {filepath}")
+    def make_browse_command(self, var, title, filetypes=None, directory=False, log_label=None):
+        """
+        Construit la commande d'un bouton « Parcourir... ».
+
+        Args:
+            var: Variable Tk recevant le chemin choisi
+            title: Titre de la boîte de dialogue
+            filetypes: Types de fichiers proposés (ignoré pour un dossier)
+            directory: True pour sélectionner un dossier plutôt qu'un fichier
+            log_label: Libellé journalisé quand le fichier choisi existe
+        """
+        ask = filedialog.askdirectory if directory else filedialog.askopenfilename
+        options = {"title": title} if directory else {"title": title, "filetypes": filetypes}
+        return partial(self._browse, var, ask, options, log_label)
+
+    def _browse(self, var, ask, options, log_label):
+        """Ouvre la boîte de dialogue et reporte le chemin choisi dans la variable."""
+        path = ask(**options)
+        if path:
+            var.set(path)
+            if log_label and _exists(path):
+                self.logger.info("%s : %s", log_label, path)
 
     def open_output_folder(self):
         output_dir = self.output_dir_var.get()
@@ -398,16 +598,17 @@ class PublipostageGUI:
                 "Attention", f"Le dossier de sortie n'existe pas : {output_dir}")
             return
         try:
-            if sys.platform == 'win32':
-                os.startfile(output_dir)
-            elif sys.platform == 'darwin':
-                subprocess.run(['open', output_dir])
+            self.logger.info("Ouverture du dossier : %s", output_dir)
+            if _STARTFILE is not None:
+                _STARTFILE(output_dir)
             else:
-                subprocess.run(['xdg-open', output_dir])
-            self.logger.info(f"Dossier ouvert : {output_dir}")
+                # Lancement sans attendre la fin de l'explorateur de fichiers
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                subprocess.Popen([opener, output_dir], stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
         except Exception as e:
             self.logger.error(
-                f"Erreur lors de l'ouverture du dossier : {str(e)}")
+                "Erreur lors de l'ouverture du dossier : %s", e)
             messagebox.showerror(
                 "Erreur", f"Impossible d'ouvrir le dossier : {str(e)}")
 
@@ -417,22 +618,25 @@ class PublipostageGUI:
             messagebox.showinfo(
                 "Information", "Un traitement est déjà en cours.")
             return
-        if not self.skip_processing_var.get() and not os.path.exists(self.input_file_var.get()):
+        # Les fichiers ont pu changer sur disque depuis le dernier lancement
+        _clear_exists_cache()
+        input_stat = None if self.skip_processing_var.get() else _stat(self.input_file_var.get())
+        if not self.skip_processing_var.get() and input_stat is None:
             messagebox.showerror(
                 "Erreur", "Le fichier Excel d'entrée n'existe pas.")
             return
-        if self.skip_processing_var.get() and not os.path.exists(self.csv_path_var.get()):
+        if self.skip_processing_var.get() and not _exists(self.csv_path_var.get()):
             messagebox.showerror(
                 "Erreur", "Le fichier CSV spécifié n'existe pas.")
             return
 
         # Vérifier les ressources logo et signature
-        if not os.path.exists(self.logo_path_var.get()):
+        if not _exists(self.logo_path_var.get()):
             if not messagebox.askyesno("Attention",
                                        "Le logo n'existe pas ou n'a pas été spécifié. Voulez-vous continuer quand même ?"):
                 return
 
-        if not os.path.exists(self.signature_path_var.get()):
+        if not _exists(self.signature_path_var.get()):
             if not messagebox.askyesno("Attention",
                                        "La signature n'existe pas ou n'a pas été spécifiée. Voulez-vous continuer quand même ?"):
                 return
@@ -442,8 +646,11 @@ class PublipostageGUI:
         self.disable_buttons(True)
         self.progress_var.set(0)
         self.update_progress_percentage(0)
+        self._last_progress = 0
+        self._last_status = None
         args = {
             "input": self.input_file_var.get(),
+            "input_stat": input_stat,
             "sheet": self.sheet_name_var.get(),
             "output_dir": self.output_dir_var.get(),
             "skip_processing": self.skip_processing_var.get(),
@@ -456,45 +663,42 @@ class PublipostageGUI:
         self.process_thread = threading.Thread(
             target=self.run_processing_thread, args=(args,), daemon=True)
         self.process_thread.start()
-        self.root.after(100, self.check_process_status)
 
     def disable_buttons(self, processing):
         """Active ou désactive les boutons d'action en fonction de l'état."""
-        state = "disabled" if processing else "normal"
-        # Pour chaque bouton dans le conteneur des boutons
-        for child in self.root.winfo_children():
-            try:
-                child.configure(state=state)
-            except:
-                pass
+        state = ["disabled"] if processing else ["!disabled"]
+        # « Quitter » reste actif : on_closing demande confirmation pendant un traitement
+        for button in (self.start_button, self.open_button):
+            button.state(state)
 
     def run_processing_thread(self, args):
         self.logger.info("Démarrage du traitement avec les paramètres :")
-        self.logger.info(f"  Fichier Excel : {args['input']}")
-        self.logger.info(f"  Feuille : {args['sheet']}")
-        self.logger.info(f"  Dossier de sortie : {args['output_dir']}")
-        self.logger.info(f"  Logo : {args['logo_path']}")
-        self.logger.info(f"  Signature : {args['signature_path']}")
+        self.logger.info("  Fichier Excel : %s", args['input'])
+        self.logger.info("  Feuille : %s", args['sheet'])
+        self.logger.info("  Dossier de sortie : %s", args['output_dir'])
+        self.logger.info("  Logo : %s", args['logo_path'])
+        self.logger.info("  Signature : %s", args['signature_path'])
         try:
+            # Laisser le préchargement terminer plutôt que d'importer en concurrence
+            if self._prewarm_thread is not None:
+                self._prewarm_thread.join()
             from main import setup_environment, generate_statistics
-            import pandas as pd
-            import time
+            from src.utils.logger import get_logger
+            from src.data_processor import nettoyer_fichier_excel, count_unique_sirets
+            from src.document_generator import (
+                OutputFormat, iter_attestations_doeth, read_processed_csv)
 
             self.update_progress(5, "Configuration de l'environnement...")
 
-            class Args:
-                def __init__(self, **kwargs):
-                    for key, value in kwargs.items():
-                        setattr(self, key, value)
-
-            args_obj = Args(**args)
-            params = setup_environment(args_obj)
+            # Environnement préparé à chaque lancement : horodatage, chemins de
+            # sortie et journal propres à ce traitement
+            params = setup_environment(argparse.Namespace(**args))
 
             # Utiliser les chemins de logo et signature spécifiés dans l'interface
-            if args['logo_path'] and os.path.exists(args['logo_path']):
+            if args['logo_path'] and _exists(args['logo_path']):
                 params['logo_path'] = args['logo_path']
 
-            if args['signature_path'] and os.path.exists(args['signature_path']):
+            if args['signature_path'] and _exists(args['signature_path']):
                 params['signature_path'] = args['signature_path']
 
             app_logger = get_logger()
@@ -503,11 +707,13 @@ class PublipostageGUI:
             csv_path = ""
             if args['skip_processing']:
                 csv_path = args['csv_path']
-                self.logger.info(f"Utilisation du CSV existant : {csv_path}")
+                self.logger.info("Utilisation du CSV existant : %s", csv_path)
+                df_processed = read_processed_csv(csv_path)
             else:
                 start_time = time.time()
                 self.logger.info(
-                    f"Traitement du fichier Excel : {args['input']}")
+                    "Traitement du fichier Excel : %s (%.1f Ko)",
+                    args['input'], args['input_stat'].st_size / 1024)
                 df_processed = nettoyer_fichier_excel(
                     input_file=args['input'],
                     output_file=params['csv_path'],
@@ -517,32 +723,34 @@ class PublipostageGUI:
                 csv_path = params['csv_path']
                 elapsed_time = time.time() - start_time
                 self.logger.info(
-                    f"Traitement terminé en {elapsed_time:.2f} sec")
+                    "Traitement terminé en %.2f sec", elapsed_time)
                 self.logger.info(
-                    f"Lignes traitées : {len(df_processed)} ; Colonnes : {df_processed.columns.size}")
+                    "Lignes traitées : %s ; Colonnes : %s", len(df_processed), df_processed.columns.size)
                 self.logger.info(
-                    f"SIRET uniques : {df_processed['SIRET'].nunique()}")
+                    "SIRET uniques : %s", count_unique_sirets(df_processed))
+            # Le DataFrame traité reste en mémoire : pas de relecture du CSV
             self.update_progress(40, "CSV créé avec succès")
-            separator = get('defaults.csv_separator', ';')
-            df_processed = pd.read_csv(csv_path, sep=separator, quoting=1)
             self.update_progress(50, "Génération des attestations...")
             start_time = time.time()
-            from document_generator import OutputFormat
-            fmt_map = {"docx": OutputFormat.DOCX,
-                       "pdf": OutputFormat.PDF, "both": OutputFormat.BOTH}
-            output_fmt = fmt_map.get(
-                args.get("output_format", "docx"), OutputFormat.DOCX)
-            generated_docs = generer_attestations_doeth(
-                csv_path=csv_path,
-                output_folder=args['output_dir'],
-                logger=app_logger,
-                signature_path=params['signature_path'],
-                logo_path=params['logo_path'],
-                output_format=output_fmt,
-            )
+            # Les valeurs des boutons radio sont celles de l'énumération
+            output_fmt = OutputFormat(args.get("output_format", "docx"))
+            # Progression de 50 à 85 % au fil des attestations écrites
+            nb_sirets = max(count_unique_sirets(df_processed), 1)
+            generated_docs = []
+            for done, files in enumerate(iter_attestations_doeth(
+                    csv_path=csv_path,
+                    output_folder=args['output_dir'],
+                    logger=app_logger,
+                    signature_path=params['signature_path'],
+                    logo_path=params['logo_path'],
+                    output_format=output_fmt,
+                    df=df_processed,
+            ), 1):
+                generated_docs.extend(files)
+                self.update_progress(50 + 35 * min(done, nb_sirets) // nb_sirets)
             elapsed_time = time.time() - start_time
             self.logger.info(
-                f"Attestations générées en {elapsed_time:.2f} sec : {len(generated_docs)} documents")
+                "Attestations générées en %.2f sec : %s documents", elapsed_time, len(generated_docs))
             self.update_progress(85, "Attestations générées")
             self.update_progress(90, "Calcul des statistiques...")
             try:
@@ -550,7 +758,7 @@ class PublipostageGUI:
             except:
                 stats = {
                     "total_rows": len(df_processed),
-                    "unique_sirets": df_processed['SIRET'].nunique(),
+                    "unique_sirets": count_unique_sirets(df_processed),
                     "unique_clients": df_processed[
                         'NOM_CLIENT'].nunique() if 'NOM_CLIENT' in df_processed.columns else 0,
                     "total_docs": len(generated_docs)
@@ -559,56 +767,95 @@ class PublipostageGUI:
                     stats["total_etp"] = df_processed['ETP_ANNUEL'].sum()
             self.update_progress(95, "Finalisation...")
             self.logger.info("=== BILAN DU TRAITEMENT ===")
-            self.logger.info(f"Total attestations : {len(generated_docs)}")
+            self.logger.info("Total attestations : %s", len(generated_docs))
             self.logger.info(
-                f"SIRET traités : {stats.get('unique_sirets', 'N/A')}")
+                "SIRET traités : %s", stats.get('unique_sirets', 'N/A'))
             if 'unique_clients' in stats:
                 self.logger.info(
-                    f"Clients uniques : {stats['unique_clients']}")
+                    "Clients uniques : %s", stats['unique_clients'])
             if 'total_etp' in stats:
-                self.logger.info(f"Total ETP : {stats['total_etp']:.2f}")
-            self.logger.info(f"Dossier de sortie : {args['output_dir']}")
+                self.logger.info("Total ETP : %.2f", stats['total_etp'])
+            self.logger.info("Dossier de sortie : %s", args['output_dir'])
             self.logger.info("=== TRAITEMENT TERMINÉ AVEC SUCCÈS ===")
             self.update_progress(100, "Traitement terminé")
         except Exception as e:
-            self.logger.error(f"Erreur lors du traitement : {str(e)}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.error(
+                "Erreur lors du traitement : %s: %s", type(e).__name__, e)
+            if args['debug']:
+                import traceback
+                self.logger.error(traceback.format_exc())
             self.update_progress(100, "Erreur lors du traitement")
         finally:
             self.processing = False
+            try:
+                self.root.after_idle(self.on_processing_done)
+            except (tk.TclError, RuntimeError):
+                # Fenêtre fermée pendant le traitement : plus rien à mettre à jour
+                pass
 
     def update_progress(self, value, status_text=None):
-        def update():
+        """Enregistre la progression ; l'affichage est rafraîchi dès que Tk est inactif."""
+        # Les valeurs intermédiaires sans message trop rapprochées sont ignorées
+        now = time.monotonic()
+        if (status_text is None and value not in (0, 100)
+                and now - self._last_progress_ts < 0.05):
+            return
+        self._last_progress_ts = now
+
+        # Fusion avec la mise à jour encore en attente : on garde la dernière
+        # valeur sans perdre un message d'état qui n'a pas encore été affiché
+        pending = self._pending_progress
+        if status_text is None and pending is not None:
+            status_text = pending[1]
+        self._pending_progress = (value, status_text)
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self.root.after_idle(self._flush_progress)
+
+    def _flush_progress(self):
+        """Applique la dernière progression reçue dans le thread de l'interface."""
+        self._progress_scheduled = False
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is None:
+            return
+        value, status_text = pending
+        percent = max(0, min(100, int(value)))
+        if percent != self._last_progress:
+            self._last_progress = percent
             self.progress_var.set(value)
-            self.update_progress_percentage(value)
-            if status_text:
-                self.status_label.configure(text=status_text)
-
-        self.root.after(0, update)
+            self.update_progress_percentage(percent)
+        if status_text and status_text != self._last_status:
+            self._last_status = status_text
+            self.status_label.configure(text=status_text)
 
     def update_progress_percentage(self, value):
         """Met à jour le label du pourcentage de la barre de progression."""
-        self.progress_percentage.configure(text=f"{int(value)}%")
-
-    def check_process_status(self):
-        if not self.processing:
-            self.disable_buttons(False)
-            if self.progress_var.get() == 100:
-                if "Erreur" not in self.status_label.cget("text"):
-                    messagebox.showinfo(
-                        "Information", "Traitement terminé avec succès!")
-                    if messagebox.askyesno("Information", "Ouvrir le dossier des attestations générées ?"):
-                        self.open_output_folder()
+        percent = max(0, min(100, int(value)))
+        if percent == self._last_pct:
             return
-        self.root.after(100, self.check_process_status)
+        self._last_pct = percent
+        self.progress_percentage.configure(text=_PERCENT_LABELS[percent])
+
+    def on_processing_done(self):
+        """Réactive l'interface à la fin du traitement (appelé par le thread de travail)."""
+        self._flush_progress()
+        self.disable_buttons(False)
+        if self.progress_var.get() == 100:
+            if "Erreur" not in (self._last_status or ""):
+                messagebox.showinfo(
+                    "Information", "Traitement terminé avec succès!")
+                if messagebox.askyesno("Information", "Ouvrir le dossier des attestations générées ?"):
+                    self.open_output_folder()
 
     def on_closing(self):
         if self.processing:
-            if messagebox.askyesno("Confirmation", "Un traitement est en cours. Quitter malgré tout ?"):
-                self.root.destroy()
-        else:
-            self.root.destroy()
+            if not messagebox.askyesno("Confirmation", "Un traitement est en cours. Quitter malgré tout ?"):
+                return
+        # Plus de relève de la file ni d'affichage une fois la fenêtre fermée
+        if self._log_poll_id is not None:
+            self.root.after_cancel(self._log_poll_id)
+        self.text_handler.close()
+        self.root.destroy()
 
 
 def main():
@@ -629,6 +876,11 @@ def main():
     center_x = int((screen_width - window_width) / 2)
     center_y = int((screen_height - window_height) / 2)
     root.geometry(f"{window_width}x{window_height}+{center_x}+{center_y}")
+
+    # Les objets créés pour l'interface vivent jusqu'à la fermeture :
+    # on les exclut des collectes suivantes du ramasse-miettes.
+    gc.collect()
+    gc.freeze()
     root.mainloop()
 
 
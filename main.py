@@ -7,20 +7,25 @@ Ce script orchestre l'ensemble du processus de traitement des données
 et de génération des attestations DOETH.
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import time
 import argparse
 import datetime
-import pandas as pd
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 
-from src.utils.config import Config, get
+from src.utils.config import config, get
 from src.utils.logger import setup_logger, get_logger
-from src.data_processor import nettoyer_fichier_excel
-from src.document_generator import generer_attestations_doeth
+
+# pandas et les modules de traitement sont importés dans les fonctions qui
+# les utilisent : --help et le chargement du module restent rapides
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def parse_arguments():
@@ -99,8 +104,13 @@ def setup_environment(args) -> Dict[str, Any]:
     # Déterminer le niveau de log
     console_level = logging.DEBUG if args.debug else logging.INFO
 
-    # Configurer le logger
+    # Chemins de la configuration, lus une seule fois
     logs_dir = get('paths.logs_dir')
+    input_dir = get('paths.input_dir')
+    processed_dir = get('paths.processed_dir')
+    output_dir = get('paths.output_dir')
+
+    # Configurer le logger
     timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
     logger = setup_logger(
         logs_dir=logs_dir,
@@ -112,7 +122,7 @@ def setup_environment(args) -> Dict[str, Any]:
 
     logger.info("=== DÉMARRAGE DU PUBLIPOSTAGE DOETH ===")
     logger.info(
-        f"Date et heure: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
+        "Date et heure: %s", datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S'))
 
     # Collecter les paramètres
     params = {
@@ -125,7 +135,6 @@ def setup_environment(args) -> Dict[str, Any]:
     if args.input:
         params["input_file"] = args.input
     else:
-        input_dir = get('paths.input_dir')
         input_filename = get('defaults.input_filename')
         params["input_file"] = os.path.join(input_dir, input_filename)
 
@@ -139,7 +148,7 @@ def setup_environment(args) -> Dict[str, Any]:
     if args.output_dir:
         params["output_dir"] = args.output_dir
     else:
-        params["output_dir"] = get('paths.output_dir')
+        params["output_dir"] = output_dir
 
     # Déterminer si on ignore l'étape de traitement
     params["skip_processing"] = args.skip_processing
@@ -148,21 +157,17 @@ def setup_environment(args) -> Dict[str, Any]:
     if args.csv_path:
         params["csv_path"] = args.csv_path
     else:
-        processed_dir = get('paths.processed_dir')
         params["csv_path"] = os.path.join(
             processed_dir, f"processed_{timestamp}.csv")
 
     # Vérification des chemins et création des dossiers nécessaires
-    dirs_to_check = [
-        logs_dir,
-        get('paths.input_dir'),
-        get('paths.processed_dir'),
-        get('paths.output_dir'),
-    ]
+    # (dédoublonnés : plusieurs chemins peuvent désigner le même dossier)
+    dirs_to_check = dict.fromkeys(
+        os.path.normpath(d) for d in (logs_dir, input_dir, processed_dir, output_dir))
 
     for dir_path in dirs_to_check:
         if not os.path.exists(dir_path):
-            logger.info(f"Création du dossier: {dir_path}")
+            logger.info("Création du dossier: %s", dir_path)
             os.makedirs(dir_path, exist_ok=True)
 
     # Vérification des ressources
@@ -174,13 +179,13 @@ def setup_environment(args) -> Dict[str, Any]:
         ("Signature", params["signature_path"])
     ]:
         if not resource_path or not os.path.exists(resource_path):
-            logger.warning(f"{resource_name} non trouvé: {resource_path}")
+            logger.warning("%s non trouvé: %s", resource_name, resource_path)
         else:
-            logger.info(f"{resource_name} trouvé: {resource_path}")
+            logger.info("%s trouvé: %s", resource_name, resource_path)
 
     # Vérification du fichier d'entrée
     if not params["skip_processing"] and not os.path.exists(params["input_file"]):
-        logger.error(f"Fichier d'entrée non trouvé: {params['input_file']}")
+        logger.error("Fichier d'entrée non trouvé: %s", params['input_file'])
         raise FileNotFoundError(
             f"Fichier d'entrée non trouvé: {params['input_file']}")
 
@@ -188,7 +193,7 @@ def setup_environment(args) -> Dict[str, Any]:
     return params
 
 
-def process_data(params: Dict[str, Any], logger: logging.Logger) -> str:
+def process_data(params: Dict[str, Any], logger: logging.Logger) -> Tuple[str, pd.DataFrame]:
     """
     Traite les données Excel pour préparer le fichier CSV intermédiaire.
 
@@ -197,19 +202,21 @@ def process_data(params: Dict[str, Any], logger: logging.Logger) -> str:
         logger:
 
     Returns:
-        str: Chemin vers le fichier CSV traité
+        Tuple[str, pd.DataFrame]: Chemin vers le fichier CSV traité et données traitées
     """
+    from src.data_processor import nettoyer_fichier_excel, count_unique_sirets
+    from src.document_generator import read_processed_csv
 
     if params["skip_processing"]:
         csv_path = params["csv_path"]
         if not os.path.exists(csv_path):
-            logger.error(f"Fichier CSV spécifié non trouvé: {csv_path}")
+            logger.error("Fichier CSV spécifié non trouvé: %s", csv_path)
             raise FileNotFoundError(
                 f"Fichier CSV spécifié non trouvé: {csv_path}")
 
         logger.info(
-            f"Étape de traitement ignorée, utilisation du CSV existant: {csv_path}")
-        return csv_path
+            "Étape de traitement ignorée, utilisation du CSV existant: %s", csv_path)
+        return csv_path, read_processed_csv(csv_path)
 
     logger.info("=== ÉTAPE 1: TRAITEMENT DES DONNÉES EXCEL ===")
 
@@ -221,28 +228,29 @@ def process_data(params: Dict[str, Any], logger: logging.Logger) -> str:
         sheet_name = params["sheet_name"]
 
         logger.info(
-            f"Traitement du fichier: {input_file}, feuille: {sheet_name}")
-        logger.info(f"Fichier CSV de sortie: {csv_path}")
+            "Traitement du fichier: %s, feuille: %s", input_file, sheet_name)
+        logger.info("Fichier CSV de sortie: %s", csv_path)
 
         # Appel à la fonction de traitement des données
         df_processed = nettoyer_fichier_excel(
             input_file, logger, csv_path, sheet_name)
 
         elapsed_time = time.time() - start_time
-        logger.info(f"Traitement terminé en {elapsed_time:.2f} secondes")
+        logger.info("Traitement terminé en %.2f secondes", elapsed_time)
         logger.info(
-            f"Données traitées: {len(df_processed)} lignes, {df_processed.columns.size} colonnes")
+            "Données traitées: %s lignes, %s colonnes", len(df_processed), df_processed.columns.size)
         logger.info(
-            f"Nombre de SIRET uniques: {df_processed['SIRET'].nunique()}")
+            "Nombre de SIRET uniques: %s", count_unique_sirets(df_processed))
 
-        return csv_path
+        return csv_path, df_processed
 
     except Exception as e:
-        logger.error(f"Erreur lors du traitement des données: {str(e)}")
+        logger.error("Erreur lors du traitement des données: %s", e)
         raise
 
 
-def generate_documents(params: Dict[str, Any], csv_path: str, logger: logging.Logger) -> List[str]:
+def generate_documents(params: Dict[str, Any], csv_path: str, logger: logging.Logger,
+                       df: Optional[pd.DataFrame] = None) -> List[str]:
     """
     Génère les attestations DOETH à partir du fichier CSV traité.
 
@@ -250,10 +258,13 @@ def generate_documents(params: Dict[str, Any], csv_path: str, logger: logging.Lo
         params: Paramètres d'exécution
         csv_path: Chemin vers le fichier CSV traité
         logger:
+        df: Données déjà chargées ; si None, le CSV est relu
 
     Returns:
         List[str]: Liste des chemins des attestations générées
     """
+    from src.document_generator import generer_attestations_doeth
+
     logger.info("=== ÉTAPE 2: GÉNÉRATION DES ATTESTATIONS ===")
 
     start_time = time.time()
@@ -263,8 +274,8 @@ def generate_documents(params: Dict[str, Any], csv_path: str, logger: logging.Lo
         logo_path = params["logo_path"]
         signature_path = params["signature_path"]
 
-        logger.info(f"Génération des attestations à partir de: {csv_path}")
-        logger.info(f"Dossier de sortie: {output_dir}")
+        logger.info("Génération des attestations à partir de: %s", csv_path)
+        logger.info("Dossier de sortie: %s", output_dir)
 
         # Appel à la fonction de génération des attestations
         generated_docs = generer_attestations_doeth(
@@ -274,20 +285,47 @@ def generate_documents(params: Dict[str, Any], csv_path: str, logger: logging.Lo
             signature_path=signature_path,
             logo_path=logo_path,
             output_format=params.get("output_format"),
+            df=df,
         )
 
         elapsed_time = time.time() - start_time
-        logger.info(f"Génération terminée en {elapsed_time:.2f} secondes")
-        logger.info(f"Nombre d'attestations générées: {len(generated_docs)}")
+        logger.info("Génération terminée en %.2f secondes", elapsed_time)
+        logger.info("Nombre d'attestations générées: %s", len(generated_docs))
 
         return generated_docs
 
     except Exception as e:
         logger.error(
-            f"Erreur lors de la génération des attestations: {str(e)}")
+            "Erreur lors de la génération des attestations: %s", e)
         raise
 
 
+def _count_values(series: pd.Series) -> Dict[Any, int]:
+    """
+    Compte les occurrences de chaque valeur, de la plus fréquente à la moins fréquente.
+
+    Pour une colonne catégorielle, le comptage se fait directement sur les
+    codes entiers avec numpy.bincount, sans hachage des valeurs.
+
+    Args:
+        series: Colonne à dénombrer
+
+    Returns:
+        Dict[Any, int]: Nombre d'occurrences par valeur (valeurs manquantes exclues)
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.value_counts().to_dict()
+
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    order = np.argsort(-counts, kind='stable')
+    categories = series.cat.categories
+    return {categories[i]: int(counts[i]) for i in order if counts[i]}
+
+
 def generate_statistics(df: pd.DataFrame, generated_docs: List[str]) -> Dict[str, Any]:
     """
     Génère des statistiques sur le traitement effectué.
@@ -299,6 +337,8 @@ def generate_statistics(df: pd.DataFrame, generated_docs: List[str]) -> Dict[str
     Returns:
         Dict[str, Any]: Dictionnaire contenant les statistiques
     """
+    from src.data_processor import count_unique_sirets
+
     logger = get_logger("main.generate_statistics")
     logger.info("=== ÉTAPE 3: GÉNÉRATION DES STATISTIQUES ===")
 
@@ -307,54 +347,60 @@ def generate_statistics(df: pd.DataFrame, generated_docs: List[str]) -> Dict[str
     try:
         # Statistiques de base
         stats["total_rows"] = len(df)
-        stats["unique_sirets"] = df['SIRET'].nunique()
+        stats["unique_sirets"] = count_unique_sirets(df)
         stats["unique_clients"] = df['NOM_CLIENT'].nunique(
         ) if 'NOM_CLIENT' in df.columns else 0
         stats["total_docs"] = len(generated_docs)
 
         # Statistiques par regroupement si la colonne existe
         if 'REGROUPEMENT' in df.columns:
-            regroupements = df['REGROUPEMENT'].value_counts().to_dict()
+            regroupements = _count_values(df['REGROUPEMENT'])
             stats["regroupements"] = regroupements
-            logger.info(f"Répartition par regroupement: {regroupements}")
+            logger.info("Répartition par regroupement: %s", regroupements)
+
+        # Sommes et moyennes des colonnes numériques en un seul appel
+        numeric_cols = [col for col in ('ETP_ANNUEL', 'NB_HEURES') if col in df.columns]
+        totals = df[numeric_cols].agg(['sum', 'mean']) if numeric_cols else None
 
         # Statistiques sur les ETP
         if 'ETP_ANNUEL' in df.columns:
-            stats["total_etp"] = df['ETP_ANNUEL'].sum()
-            stats["avg_etp_per_employee"] = df['ETP_ANNUEL'].mean()
-            stats["avg_etp_per_siret"] = df.groupby(
-                'SIRET')['ETP_ANNUEL'].sum().mean()
-            logger.info(f"Total ETP: {stats['total_etp']:.2f}")
+            stats["total_etp"] = totals.at['sum', 'ETP_ANNUEL']
+            stats["avg_etp_per_employee"] = totals.at['mean', 'ETP_ANNUEL']
+            # Moyenne des totaux par SIRET = total / nombre de SIRET
+            stats["avg_etp_per_siret"] = (
+                stats["total_etp"] / stats["unique_sirets"]
+                if stats["unique_sirets"] else 0.0)
+            logger.info("Total ETP: %.2f", stats['total_etp'])
             logger.info(
-                f"Moyenne ETP par employé: {stats['avg_etp_per_employee']:.2f}")
+                "Moyenne ETP par employé: %.2f", stats['avg_etp_per_employee'])
             logger.info(
-                f"Moyenne ETP par SIRET: {stats['avg_etp_per_siret']:.2f}")
+                "Moyenne ETP par SIRET: %.2f", stats['avg_etp_per_siret'])
 
         # Statistiques sur les heures
         if 'NB_HEURES' in df.columns:
-            stats["total_heures"] = df['NB_HEURES'].sum()
-            stats["avg_heures_per_employee"] = df['NB_HEURES'].mean()
-            logger.info(f"Total heures: {stats['total_heures']:.2f}")
+            stats["total_heures"] = totals.at['sum', 'NB_HEURES']
+            stats["avg_heures_per_employee"] = totals.at['mean', 'NB_HEURES']
+            logger.info("Total heures: %.2f", stats['total_heures'])
             logger.info(
-                f"Moyenne heures par employé: {stats['avg_heures_per_employee']:.2f}")
+                "Moyenne heures par employé: %.2f", stats['avg_heures_per_employee'])
 
         # Autres statistiques
-        stats["file_count_by_extension"] = {}
-        for doc in generated_docs:
-            ext = os.path.splitext(doc)[1].lower()
-            if ext in stats["file_count_by_extension"]:
-                stats["file_count_by_extension"][ext] += 1
-            else:
-                stats["file_count_by_extension"][ext] = 1
+        # Les attestations sont des .docx ou .pdf : test direct du suffixe,
+        # splitext n'est utilisé que pour un éventuel autre fichier
+        stats["file_count_by_extension"] = dict(Counter(
+            '.docx' if doc.endswith('.docx') else
+            '.pdf' if doc.endswith('.pdf') else
+            os.path.splitext(doc)[1].lower()
+            for doc in generated_docs))
 
         logger.info(
-            f"Types de fichiers générés: {stats['file_count_by_extension']}")
+            "Types de fichiers générés: %s", stats['file_count_by_extension'])
 
         return stats
 
     except Exception as e:
         logger.error(
-            f"Erreur lors de la génération des statistiques: {str(e)}")
+            "Erreur lors de la génération des statistiques: %s", e)
         # En cas d'erreur, on renvoie tout de même les statistiques partielles
         return stats
 
@@ -371,7 +417,7 @@ def main():
         params = setup_environment(args)
 
         # Déterminer l'environnement d'exécution
-        env_name, _ = Config().get_environment()
+        env_name, _ = config.get_environment()
 
         # Créer un logger spécifique pour la session principale
         logs_dir = get('paths.logs_dir')
@@ -386,18 +432,14 @@ def main():
         start_time = time.time()
 
         # Étape 1: Traitement des données
-        csv_path = process_data(params, logger)
-
-        # Charger le DataFrame pour les statistiques finales
-        separator = get('defaults.csv_separator', ';')
-        df_processed = pd.read_csv(csv_path, sep=separator, quoting=1)
+        csv_path, df_processed = process_data(params, logger)
 
         # Étape 2: Génération des attestations
+        # Les choix de --format sont les valeurs de l'énumération
         from src.document_generator import OutputFormat
-        fmt_map = {"docx": OutputFormat.DOCX,
-                   "pdf": OutputFormat.PDF, "both": OutputFormat.BOTH}
-        params["output_format"] = fmt_map.get(args.format, OutputFormat.DOCX)
-        generated_docs = generate_documents(params, csv_path, logger)
+        params["output_format"] = OutputFormat(args.format)
+        generated_docs = generate_documents(
+            params, csv_path, logger, df=df_processed)
 
         # Étape 3: Génération des statistiques
         stats = generate_statistics(df_processed, generated_docs)
@@ -405,25 +447,29 @@ def main():
         # Bilan final
         total_time = time.time() - start_time
         logger.info("=== BILAN DU TRAITEMENT ===")
-        logger.info(f"Durée totale d'exécution: {total_time:.2f} secondes")
+        logger.info("Durée totale d'exécution: %.2f secondes", total_time)
         logger.info(
-            f"Nombre total d'attestations générées: {len(generated_docs)}")
-        logger.info(f"Nombre de SIRET traités: {stats['unique_sirets']}")
-        logger.info(f"Nombre de clients uniques: {stats['unique_clients']}")
+            "Nombre total d'attestations générées: %s", len(generated_docs))
+        logger.info("Nombre de SIRET traités: %s", stats['unique_sirets'])
+        logger.info("Nombre de clients uniques: %s", stats['unique_clients'])
 
         if 'total_etp' in stats:
             logger.info(
-                f"Total d'unités bénéficiaires (ETP): {stats['total_etp']:.2f}")
+                "Total d'unités bénéficiaires (ETP): %.2f", stats['total_etp'])
 
-        logger.info(f"Dossier de sortie: {params['output_dir']}")
+        logger.info("Dossier de sortie: %s", params['output_dir'])
         logger.info("=== TRAITEMENT TERMINÉ AVEC SUCCÈS ===")
 
         return 0
 
     except Exception as e:
         logger = get_logger("main")
-        logger.error(f"Erreur fatale lors de l'exécution: {str(e)}")
-        logger.exception("Détail de l'erreur:")
+        logger.error("Erreur fatale lors de l'exécution: %s", e)
+        # La pile d'appels n'est formatée qu'en mode debug, comme dans l'interface
+        if args.debug or logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Détail de l'erreur:")
+        else:
+            logger.error("Relancer avec --debug pour afficher le détail de l'erreur")
         logger.error("=== TRAITEMENT TERMINÉ AVEC ERREUR ===")
         return 1
 
@@ -0,0 +1,61 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+Spécification PyInstaller de l'exécutable Publipostage DOETH.
+
+Construction : uv run pyinstaller publipostage.spec
+Produit un dossier dist/PublipostageDOETH (mode onedir : pas de décompression
+de l'archive à chaque lancement) et exclut les modules inutiles à l'exécution
+(tests, IPython, documentation) pour réduire le temps de démarrage.
+"""
+import sys
+
+# UPX ralentit le chargement des DLL et déclenche certains antivirus sous Windows
+USE_UPX = sys.platform != "win32"
+
+EXCLUDES = [
+    "tkinter.test",
+    "test",
+    "unittest",
+    "pydoc_data",
+    "pandas.tests",
+    "numpy.testing",
+    "IPython",
+    "ipykernel",
+    "jupyter_client",
+    "notebook",
+    "sphinx",
+    "matplotlib",
+]
+
+a = Analysis(
+    ["build_app.py"],
+    pathex=[],
+    binaries=[],
+    datas=[("config/config.yaml", "config")],
+    hiddenimports=[],
+    hookspath=[],
+    runtime_hooks=[],
+    excludes=EXCLUDES,
+    noarchive=False,
+    optimize=1,
+)
+pyz = PYZ(a.pure, a.zipped_data)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name="PublipostageDOETH",
+    console=False,
+    upx=USE_UPX,
+    upx_exclude=["vcruntime140.dll", "python3*.dll"],
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    upx=USE_UPX,
+    upx_exclude=["vcruntime140.dll", "python3*.dll"],
+    name="PublipostageDOETH",
+)
@@ -10,8 +10,12 @@ import pandas as pd
 import numpy as np
 import csv
 import datetime
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union, Dict, Any, Tuple
+from typing import Optional, Union, Dict, Any, Tuple, List
 
 from src.utils.config import get
 from src.utils.logger import get_logger
@@ -19,6 +23,75 @@ from src.utils.logger import get_logger
 # Initialisation du logger
 logger = get_logger(__name__)
 
+# Colonnes clés pour le regroupement et colonnes sommées par aggregate_data
+GROUP_COLUMNS = [
+    'CODE_REGROUPEMENT', 'REGROUPEMENT', 'SIREN', 'NIC', 'SIRET',
+    'NOM_CLIENT', 'ADRESSE_CLIENT', 'CP_CLIENT', 'VILLE_CLIENT',
+    'APE', 'NOM', 'PRENOM', 'DATE_NAISSANCE', 'ANNEE',
+    'QUALIFICATION', 'ETP_MAJORE'
+]
+AGG_COLUMNS = ['ETP_ANNUEL', 'NB_HEURES']
+
+# Colonnes de regroupement déterminées par le SIRET (identifiants et coordonnées client)
+SIRET_COLUMNS = frozenset([
+    'SIREN', 'NIC', 'NOM_CLIENT', 'ADRESSE_CLIENT', 'CP_CLIENT', 'VILLE_CLIENT', 'APE'
+])
+
+# Seules ces colonnes subsistent après l'agrégation : les autres ne sont pas chargées
+_USED_COLUMNS = frozenset(GROUP_COLUMNS + AGG_COLUMNS)
+
+
+# Version du contenu des copies Parquet du classeur : à incrémenter quand la
+# lecture change, pour ne pas relire des copies produites par l'ancienne lecture
+_EXCEL_CACHE_VERSION = 2
+
+
+def _excel_cache_file(input_file: str, sheet_name: str) -> str:
+    """
+    Chemin de la copie Parquet d'une feuille Excel, indexée par fichier, date et taille.
+
+    Le nom est formé de deux clés : <classeur et feuille>_<version du fichier>.
+    Toute modification du classeur change la seconde : une copie n'est donc
+    jamais relue pour une version différente du fichier.
+
+    Args:
+        input_file (str): Chemin vers le fichier Excel source
+        sheet_name (str): Nom de la feuille chargée
+
+    Returns:
+        str: Chemin du fichier Parquet dans le répertoire des données traitées
+    """
+    stat = os.stat(input_file)
+    source_key = hashlib.blake2b(
+        f"{Path(input_file).resolve()}|{sheet_name}".encode(), digest_size=8).hexdigest()
+    version_key = hashlib.blake2b(
+        f"{_EXCEL_CACHE_VERSION}|{stat.st_mtime_ns}|{stat.st_size}".encode(),
+        digest_size=8).hexdigest()
+    cache_dir = os.path.join(get('paths.processed_dir', './data/processed'), 'cache')
+    return os.path.join(cache_dir, f"{source_key}_{version_key}.parquet")
+
+
+def _prune_excel_cache(cache_file: str) -> None:
+    """
+    Supprime les copies Parquet des versions précédentes du même classeur.
+
+    Le cache ne garde ainsi qu'une copie par classeur et par feuille, au lieu
+    d'une par enregistrement du fichier.
+
+    Args:
+        cache_file (str): Copie qui vient d'être écrite (conservée)
+    """
+    cache_dir, name = os.path.split(cache_file)
+    prefix = name.split('_', 1)[0] + '_'
+    for entry in os.scandir(cache_dir):
+        # Les fichiers .tmp en cours d'écriture par un autre processus sont ignorés
+        if entry.name.startswith(prefix) and entry.name.endswith('.parquet') and entry.name != name:
+            try:
+                os.remove(entry.path)
+                logger.debug("Ancienne copie du classeur supprimée: %s", entry.name)
+            except OSError as e:
+                logger.warning("Copie obsolète non supprimée %s: %s", entry.name, e)
+
 
 def load_excel_data(input_file: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
     """
@@ -39,22 +112,73 @@ def load_excel_data(input_file: str, sheet_name: Optional[str] = None) -> pd.Dat
         sheet_name = get('defaults.excel_sheet', 'Feuil1')
 
     logger.info(
-        f"Chargement du fichier Excel: {input_file}, feuille: {sheet_name}")
+        "Chargement du fichier Excel: %s, feuille: %s", input_file, sheet_name)
 
     if not os.path.exists(input_file):
         error_msg = f"Fichier Excel non trouvé: {input_file}"
         logger.error(error_msg)
         raise FileNotFoundError(error_msg)
 
+    # Classeur déjà lu lors d'une exécution précédente : relecture de la copie Parquet
+    # (option excel_cache, désactivée par défaut : la copie contient des données personnelles)
+    cache_file = None
+    if get('defaults.excel_cache', False):
+        cache_file = _excel_cache_file(input_file, sheet_name)
+        if os.path.exists(cache_file):
+            try:
+                df = pd.read_parquet(cache_file)
+                # Parquet relit les chaînes en string[python] : même type qu'à la lecture du classeur
+                str_cols = df.select_dtypes(include='string').columns
+                if len(str_cols):
+                    df[str_cols] = df[str_cols].astype('string[pyarrow]')
+                logger.info(
+                    "Données Excel relues depuis le cache: %s lignes, %s colonnes",
+                    len(df), len(df.columns))
+                return df
+            except Exception as e:
+                logger.warning("Cache Excel illisible, relecture du classeur: %s", e)
+
     try:
-        df = pd.read_excel(input_file, sheet_name=sheet_name)
+        read_options = dict(sheet_name=sheet_name, usecols=_USED_COLUMNS.__contains__,
+                            dtype={'SIREN': str, 'NIC': str})
+        # Lecteur calamine (Rust) si python-calamine est installé, openpyxl sinon.
+        # Les cellules passent dans les deux cas par read_excel : entiers,
+        # valeurs manquantes et types des colonnes restent identiques
+        try:
+            df = pd.read_excel(input_file, engine='calamine', **read_options)
+        except ImportError:
+            df = pd.read_excel(input_file, **read_options)
+
+        # Colonnes texte en chaînes Arrow (tampons contigus) plutôt qu'en objets Python
+        str_cols = df.select_dtypes(include='object').columns
+        if len(str_cols):
+            try:
+                df[str_cols] = df[str_cols].astype('string[pyarrow]')
+            except ImportError:
+                logger.debug("pyarrow absent : colonnes texte conservées en object")
+
         row_count = len(df)
         col_count = len(df.columns)
         logger.info(
-            f"Fichier Excel chargé avec succès: {row_count} lignes, {col_count} colonnes")
+            "Fichier Excel chargé avec succès: %s lignes, %s colonnes", row_count, col_count)
 
         # Afficher un aperçu des colonnes pour le débogage
-        logger.debug(f"Colonnes disponibles: {', '.join(df.columns)}")
+        logger.debug("Colonnes disponibles: %s", ', '.join(df.columns))
+
+        if cache_file is not None:
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                # Écriture dans un fichier propre au processus puis remplacement
+                # atomique : deux traitements parallèles du même classeur ne
+                # relisent jamais une copie à moitié écrite
+                tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+                df.to_parquet(tmp_file, index=False)
+                os.replace(tmp_file, cache_file)
+                _prune_excel_cache(cache_file)
+            except ImportError:
+                logger.debug("pyarrow absent : pas de cache du classeur Excel")
+            except Exception as e:
+                logger.warning("Cache Excel non créé: %s", e)
 
         return df
     except Exception as e:
@@ -63,109 +187,254 @@ def load_excel_data(input_file: str, sheet_name: Optional[str] = None) -> pd.Dat
         raise ValueError(error_msg)
 
 
+def _is_ascii_digits(values: np.ndarray) -> np.ndarray:
+    """
+    Indique pour chaque chaîne d'un tableau numpy (dtype U) si elle ne contient que des chiffres ASCII.
+
+    Les caractères sont lus comme une matrice d'entiers UCS-4 : la vérification
+    est une simple comparaison de plage, vectorisée sur toutes les lignes.
+
+    Args:
+        values (np.ndarray): Tableau de chaînes de largeur fixe
+
+    Returns:
+        np.ndarray: Masque booléen des chaînes valides
+    """
+    codes = np.ascontiguousarray(values).view(np.uint32).reshape(
+        len(values), values.itemsize // 4)
+    # Les positions au-delà de la fin de chaque chaîne valent 0 (remplissage)
+    return ((codes - 48 < 10) | (codes == 0)).all(axis=1)
+
+
+def _count_overlong(codes: np.ndarray, width: int) -> int:
+    """
+    Compte les codes complétés par zfill(width) dont la longueur dépasse width.
+
+    Après zfill, aucun code n'est plus court que width : si la largeur du
+    tableau vaut width, tous les codes ont la bonne longueur sans avoir à les
+    mesurer un par un.
+
+    Args:
+        codes (np.ndarray): Codes complétés (dtype U)
+        width (int): Longueur attendue
+
+    Returns:
+        int: Nombre de codes trop longs
+    """
+    if codes.dtype.itemsize == width * 4:
+        return 0
+    return int(np.count_nonzero(np.char.str_len(codes) != width))
+
+
+def _concat_codes(siren: np.ndarray, nic: np.ndarray) -> np.ndarray:
+    """
+    Concatène les SIREN et NIC complétés par zfill (tableaux numpy de chaînes).
+
+    Après zfill, chaque SIREN a au moins 9 caractères et chaque NIC au moins 5 :
+    si les tableaux ont exactement ces largeurs, toutes les chaînes les ont
+    aussi et la concaténation se réduit à une copie des points de code dans un
+    tableau préalloué de largeur 14, sans traitement chaîne par chaîne.
+
+    Args:
+        siren (np.ndarray): Codes SIREN (dtype U)
+        nic (np.ndarray): Codes NIC (dtype U)
+
+    Returns:
+        np.ndarray: Codes SIRET
+    """
+    if siren.dtype.itemsize != 9 * 4 or nic.dtype.itemsize != 5 * 4:
+        # Codes trop longs présents : concaténation générique
+        return np.char.add(siren, nic)
+    out = np.empty((len(siren), 14), dtype=np.uint32)
+    out[:, :9] = np.ascontiguousarray(siren).view(np.uint32).reshape(len(siren), 9)
+    out[:, 9:] = np.ascontiguousarray(nic).view(np.uint32).reshape(len(nic), 5)
+    return out.view('U14').ravel()
+
+
 def create_siret_column(df: pd.DataFrame) -> pd.DataFrame:
     """
     Crée la colonne SIRET en combinant SIREN et NIC.
 
+    Le DataFrame reçu est modifié sur place (pas de copie intermédiaire).
+
     Args:
         df (pd.DataFrame): Le DataFrame à modifier
 
     Returns:
         pd.DataFrame: Le DataFrame avec la colonne SIRET ajoutée
     """
-    df_copy = df.copy()
-
-    if 'SIRET' not in df_copy.columns and 'SIREN' in df_copy.columns and 'NIC' in df_copy.columns:
+    if 'SIRET' not in df.columns and 'SIREN' in df.columns and 'NIC' in df.columns:
         logger.info("Création de la colonne SIRET à partir de SIREN et NIC")
 
         try:
             # Convertir en chaînes de caractères, gérer les valeurs manquantes et le formatage des codes SIREN sur 9 digit et NIC sur 5 digit
-            df_copy['SIREN'] = df_copy['SIREN'].fillna(
-                '').astype(str).str.zfill(9)
-            df_copy['NIC'] = df_copy['NIC'].fillna('').astype(str).str.zfill(5)
+            # (tableaux numpy de chaînes : chaque opération est un seul passage vectorisé)
+            siren = np.char.zfill(df['SIREN'].fillna('').to_numpy(dtype=str), 9)
+            nic = np.char.zfill(df['NIC'].fillna('').to_numpy(dtype=str), 5)
 
             # Vérifier que SIREN et NIC sont purement numériques (longueur ET contenu)
-            invalid_siren_mask = ~df_copy['SIREN'].str.isdigit()
-            if invalid_siren_mask.any():
-                n = invalid_siren_mask.sum()
-                bad_values = df_copy.loc[invalid_siren_mask,
-                                         'SIREN'].unique().tolist()
+            valid = _is_ascii_digits(siren)
+            if not valid.all():
+                invalid = ~valid
+                bad_values = pd.unique(siren[invalid]).tolist()
                 logger.warning(
-                    f"{n} SIREN non-numériques détectés (exclus): {bad_values}")
-                df_copy = df_copy[~invalid_siren_mask].copy()
-
-            invalid_nic_mask = ~df_copy['NIC'].str.isdigit()
-            if invalid_nic_mask.any():
-                n = invalid_nic_mask.sum()
-                bad_values = df_copy.loc[invalid_nic_mask,
-                                         'NIC'].unique().tolist()
+                    "%s SIREN non-numériques détectés (exclus): %s", invalid.sum(), bad_values)
+
+            invalid_nic = valid & ~_is_ascii_digits(nic)
+            if invalid_nic.any():
+                bad_values = pd.unique(nic[invalid_nic]).tolist()
                 logger.warning(
-                    f"{n} NIC non-numériques détectés (exclus): {bad_values}")
-                df_copy = df_copy[~invalid_nic_mask].copy()
+                    "%s NIC non-numériques détectés (exclus): %s", invalid_nic.sum(), bad_values)
+                valid &= ~invalid_nic
+
+            if not valid.all():
+                # Suppression sur place : pas de second passage de copie
+                df.drop(index=df.index[~valid], inplace=True)
+                siren, nic = siren[valid], nic[valid]
 
             # Vérifier la longueur après nettoyage
-            invalid_siren_len = df_copy[df_copy['SIREN'].str.len() != 9]
-            if not invalid_siren_len.empty:
+            invalid_siren_len = _count_overlong(siren, 9)
+            if invalid_siren_len:
                 logger.warning(
-                    f"Détection de {len(invalid_siren_len)} codes SIREN invalides (longueur ≠ 9)")
+                    "Détection de %s codes SIREN invalides (longueur ≠ 9)", invalid_siren_len)
 
-            invalid_nic_len = df_copy[df_copy['NIC'].str.len() != 5]
-            if not invalid_nic_len.empty:
+            invalid_nic_len = _count_overlong(nic, 5)
+            if invalid_nic_len:
                 logger.warning(
-                    f"Détection de {len(invalid_nic_len)} codes NIC invalides (longueur ≠ 5)")
+                    "Détection de %s codes NIC invalides (longueur ≠ 5)", invalid_nic_len)
 
             # Créer la colonne SIRET (14 chiffres = 9 SIREN + 5 NIC)
-            df_copy['SIRET'] = df_copy['SIREN'] + df_copy['NIC']
-            logger.info(f"{len(df_copy)} codes SIRET générés")
+            # (chaînes Arrow si la colonne source l'est, object sinon : un SIREN
+            # lu en nombre ne doit pas perdre ses zéros de tête)
+            str_dtype = df['SIREN'].dtype
+            if not isinstance(str_dtype, pd.StringDtype):
+                str_dtype = object
+            df['SIREN'] = pd.array(siren, dtype=str_dtype)
+            df['NIC'] = pd.array(nic, dtype=str_dtype)
+            df['SIRET'] = pd.array(_concat_codes(siren, nic), dtype=str_dtype)
+            logger.info("%s codes SIRET générés", len(df))
 
         except Exception as e:
             logger.error(
-                f"Erreur lors de la création de la colonne SIRET: {str(e)}")
+                "Erreur lors de la création de la colonne SIRET: %s", e)
             # En cas d'erreur, nous continuons sans la colonne SIRET
 
-    return df_copy
+    return df
+
+
+def _format_dates_dmy(dates: pd.Series) -> np.ndarray:
+    """
+    Formate des dates au format jj/mm/aaaa sans appel à strftime par valeur.
+
+    Jour, mois et année sont extraits par arithmétique sur datetime64, puis
+    leurs chiffres sont écrits directement dans une matrice de points de code
+    relue comme des chaînes de 10 caractères (aucune conversion en texte).
+
+    Args:
+        dates (pd.Series): Colonne de type datetime64 (NaT pour les dates invalides)
+
+    Returns:
+        np.ndarray: Chaînes formatées, vides pour les dates manquantes
+    """
+    days = dates.to_numpy(dtype='datetime64[D]')
+    months = days.astype('datetime64[M]')
+    day = (days - months).astype(np.int64) + 1
+    month = months.astype(np.int64) % 12 + 1
+    year = days.astype('datetime64[Y]').astype(np.int64) + 1970
+
+    # Les valeurs calculées pour NaT sont quelconques : elles sont effacées ensuite
+    codes = np.full((len(days), 10), ord('/'), dtype=np.uint32)
+    zero = ord('0')
+    codes[:, 0] = day // 10 % 10 + zero
+    codes[:, 1] = day % 10 + zero
+    codes[:, 3] = month // 10 % 10 + zero
+    codes[:, 4] = month % 10 + zero
+    for i, power in enumerate((1000, 100, 10, 1)):
+        codes[:, 6 + i] = year // power % 10 + zero
+    text = codes.view('U10').ravel().astype(object)
+    text[np.isnat(days)] = ''
+    return text
+
+
+@lru_cache(maxsize=8)
+def _date_columns(columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Colonnes dont le nom contient DATE, mémorisées par jeu de colonnes.
+
+    Args:
+        columns (Tuple[str, ...]): Noms des colonnes du DataFrame
+
+    Returns:
+        Tuple[str, ...]: Colonnes de dates potentielles
+    """
+    return tuple(col for col in columns if 'DATE' in col.upper())
 
 
 def format_dates(df: pd.DataFrame) -> pd.DataFrame:
     """
     Formate les colonnes de dates selon le format configuré.
 
+    Le DataFrame reçu est modifié sur place (pas de copie intermédiaire).
+
     Args:
         df (pd.DataFrame): Le DataFrame à modifier
 
     Returns:
         pd.DataFrame: Le DataFrame avec les dates formatées
     """
-    df_copy = df.copy()
     date_format = get('defaults.date_format', '%d/%m/%Y')
+    input_format = get('defaults.date_input_format', 'ISO8601')
 
     # Liste des colonnes contenant potentiellement des dates
-    date_columns = [col for col in df_copy.columns if 'DATE' in col.upper()]
+    date_columns = _date_columns(tuple(df.columns))
 
     for col in date_columns:
-        if col in df_copy.columns:
+        if col in df.columns:
             logger.info(
-                f"Formatage de la colonne de date: {col} au format {date_format}")
+                "Formatage de la colonne de date: %s au format %s", col, date_format)
             try:
-                # Convertir en datetime puis au format souhaité
-                df_copy[col] = pd.to_datetime(df_copy[col], errors='coerce')
-                non_null_count = df_copy[col].count()
-                null_count = df_copy[col].isna().sum()
+                # Convertir en datetime puis au format souhaité. Les cellules date
+                # d'Excel arrivent déjà en datetime64 ; sinon le format d'entrée
+                # configuré évite la déduction du format valeur par valeur
+                if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                    source = df[col]
+                    parsed = pd.to_datetime(
+                        source, format=input_format, errors='coerce', cache=True)
+                    # Valeurs présentes mais hors du format attendu (texte saisi
+                    # dans le classeur, ex. 15/03/2023) : relues jour en premier
+                    failed = parsed.isna() & source.notna() & (source.astype(str).str.strip() != '')
+                    if failed.any():
+                        logger.warning(
+                            "Colonne %s: %s dates hors format %s, "
+                            "relues au format jour/mois/année", col, failed.sum(), input_format)
+                        parsed[failed] = pd.to_datetime(
+                            source[failed], format='mixed', dayfirst=True, errors='coerce')
+                        coerced = int((parsed.isna() & failed).sum())
+                        if coerced:
+                            logger.warning(
+                                "Colonne %s: %s valeurs renseignées non reconnues comme dates",
+                                col, coerced)
+                    df[col] = parsed
+                non_null_count = df[col].count()
+                null_count = df[col].isna().sum()
 
                 if null_count > 0:
                     logger.warning(
-                        f"Colonne {col}: {null_count} valeurs non convertibles en dates")
+                        "Colonne %s: %s valeurs non convertibles en dates", col, null_count)
 
-                # Appliquer le format de date configuré
-                df_copy[col] = df_copy[col].dt.strftime(date_format).fillna('')
+                # Appliquer le format de date configuré (jj/mm/aaaa calculé par numpy)
+                if date_format == '%d/%m/%Y':
+                    df[col] = _format_dates_dmy(df[col])
+                else:
+                    df[col] = df[col].dt.strftime(date_format).fillna('')
                 logger.info(
-                    f"Colonne {col}: {non_null_count} dates formatées avec succès")
+                    "Colonne %s: %s dates formatées avec succès", col, non_null_count)
 
             except Exception as e:
                 logger.error(
-                    f"Erreur lors du formatage de la colonne {col}: {str(e)}")
+                    "Erreur lors du formatage de la colonne %s: %s", col, e)
 
-    return df_copy
+    return df
 
 
 def clean_and_transform_data(df: pd.DataFrame) -> pd.DataFrame:
@@ -173,10 +442,14 @@ def clean_and_transform_data(df: pd.DataFrame) -> pd.DataFrame:
     Nettoie et transforme les données chargées.
 
     Opérations réalisées:
+    - Exclusion des enregistrements DIFFUS
     - Création de la colonne SIRET
     - Formatage des dates
     - Nettoyage général des données
 
+    Le DataFrame reçu est modifié sur place : il ne doit plus être utilisé
+    par l'appelant après cet appel.
+
     Args:
         df (pd.DataFrame): Le DataFrame à nettoyer
 
@@ -185,15 +458,28 @@ def clean_and_transform_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Début du nettoyage et de la transformation des données")
 
-    # Créer une copie pour éviter de modifier l'original
-    df_cleaned = df.copy()
+    # Le DataFrame chargé appartient au pipeline : il est nettoyé sur place
+    df_cleaned = df
 
     # Supprimer les lignes entièrement vides
     initial_rows = len(df_cleaned)
     df_cleaned.dropna(how='all', inplace=True)
     rows_removed = initial_rows - len(df_cleaned)
     if rows_removed > 0:
-        logger.info(f"Suppression de {rows_removed} lignes entièrement vides")
+        logger.info("Suppression de %s lignes entièrement vides", rows_removed)
+
+    # Exclure les DIFFUS avant toute transformation : ni la création du SIRET
+    # ni le regroupement ne traitent ces lignes (comparaison sur le tableau
+    # numpy, les valeurs manquantes comptant comme « différent de DIFFUS »)
+    if 'CODE_REGROUPEMENT' in df_cleaned.columns:
+        logger.info(
+            "Exclusion des enregistrements avec CODE_REGROUPEMENT = 'DIFFUS'")
+        codes = df_cleaned['CODE_REGROUPEMENT'].to_numpy(dtype=object, na_value=None)
+        keep = codes != 'DIFFUS'
+        diffus_removed = len(keep) - np.count_nonzero(keep)
+        if diffus_removed:
+            df_cleaned.drop(index=df_cleaned.index[~keep], inplace=True)
+        logger.info("%s enregistrements 'DIFFUS' exclus", diffus_removed)
 
     # Création de la colonne SIRET
     df_cleaned = create_siret_column(df_cleaned)
@@ -212,21 +498,62 @@ def clean_and_transform_data(df: pd.DataFrame) -> pd.DataFrame:
                 null_count = df_cleaned[col].isna().sum()
                 if null_count > 0:
                     logger.warning(
-                        f"Colonne {col}: {null_count} valeurs non numériques remplacées par NaN")
+                        "Colonne %s: %s valeurs non numériques remplacées par NaN", col, null_count)
 
                 # Remplacer les NaN par 0 (correction pour éviter le warning avec inplace=True)
                 df_cleaned[col] = df_cleaned[col].fillna(0)
+                # Une colonne lue en chaînes Arrow donne un type nullable (Float64) :
+                # revenir au type numpy, comme pour une colonne object
+                if isinstance(df_cleaned[col].dtype, pd.api.extensions.ExtensionDtype):
+                    df_cleaned[col] = df_cleaned[col].astype(df_cleaned[col].dtype.numpy_dtype)
                 logger.info(
-                    f"Colonne {col} nettoyée et convertie en numérique")
+                    "Colonne %s nettoyée et convertie en numérique", col)
 
             except Exception as e:
                 logger.error(
-                    f"Erreur lors du nettoyage de la colonne {col}: {str(e)}")
+                    "Erreur lors du nettoyage de la colonne %s: %s", col, e)
 
-    logger.info(f"Nettoyage terminé: {len(df_cleaned)} lignes conservées")
+    logger.info("Nettoyage terminé: %s lignes conservées", len(df_cleaned))
     return df_cleaned
 
 
+def _aggregate_sorted(df: pd.DataFrame, key_cols: List[str], columns: List[str],
+                      sum_cols: List[str]) -> pd.DataFrame:
+    """
+    Agrège par tri puis sommes par tranches (np.add.reduceat), sans table de hachage.
+
+    Les lignes sont triées par SIRET, NOM, PRENOM puis les autres clés ; une
+    frontière de groupe est une ligne dont au moins une clé diffère de la
+    précédente. Les colonnes non sommées sont prises sur la première ligne du
+    groupe. Les clés ne doivent pas contenir de valeurs manquantes.
+
+    Args:
+        df (pd.DataFrame): Les données sans valeur manquante dans les clés
+        key_cols (List[str]): Colonnes définissant les groupes
+        columns (List[str]): Colonnes reprises de la première ligne de chaque groupe
+        sum_cols (List[str]): Colonnes sommées
+
+    Returns:
+        pd.DataFrame: Une ligne par groupe, triée par SIRET, NOM, PRENOM
+    """
+    leading = [col for col in ('SIRET', 'NOM', 'PRENOM') if col in key_cols]
+    sort_cols = leading + [col for col in key_cols if col not in leading]
+    df = df.sort_values(by=sort_cols, kind='stable')
+    if df.empty:
+        return df[columns + sum_cols].reset_index(drop=True)
+
+    changed = np.zeros(len(df) - 1, dtype=bool)
+    for col in sort_cols:
+        values = df[col].to_numpy()
+        changed |= values[1:] != values[:-1]
+    starts = np.concatenate(([0], np.flatnonzero(changed) + 1))
+
+    df_grouped = df[columns].iloc[starts].reset_index(drop=True)
+    for col in sum_cols:
+        df_grouped[col] = np.add.reduceat(df[col].to_numpy(), starts)
+    return df_grouped
+
+
 def aggregate_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Agrège les données par groupes pertinents.
@@ -240,12 +567,7 @@ def aggregate_data(df: pd.DataFrame) -> pd.DataFrame:
     logger.info("Agrégation des données")
 
     # Colonnes clés pour le regroupement
-    group_cols = [
-        'CODE_REGROUPEMENT', 'REGROUPEMENT', 'SIREN', 'NIC', 'SIRET',
-        'NOM_CLIENT', 'ADRESSE_CLIENT', 'CP_CLIENT', 'VILLE_CLIENT',
-        'APE', 'NOM', 'PRENOM', 'DATE_NAISSANCE', 'ANNEE',
-        'QUALIFICATION', 'ETP_MAJORE'
-    ]
+    group_cols = GROUP_COLUMNS
 
     # Vérifier quelles colonnes de regroupement sont disponibles
     available_cols = [col for col in group_cols if col in df.columns]
@@ -253,7 +575,7 @@ def aggregate_data(df: pd.DataFrame) -> pd.DataFrame:
 
     if missing_cols:
         logger.warning(
-            f"Colonnes manquantes pour l'agrégation: {', '.join(missing_cols)}")
+            "Colonnes manquantes pour l'agrégation: %s", ', '.join(missing_cols))
 
     if not available_cols:
         logger.error(
@@ -261,7 +583,7 @@ def aggregate_data(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
     # Colonnes à agréger
-    agg_cols = ['ETP_ANNUEL', 'NB_HEURES']
+    agg_cols = AGG_COLUMNS
     available_agg_cols = [col for col in agg_cols if col in df.columns]
 
     if not available_agg_cols:
@@ -269,14 +591,52 @@ def aggregate_data(df: pd.DataFrame) -> pd.DataFrame:
             "Aucune colonne à agréger disponible. Agrégation impossible.")
         return df
 
-    # Créer le dictionnaire d'agrégation (somme pour toutes les colonnes numériques)
-    agg_dict = {col: 'sum' for col in available_agg_cols}
-
     # Effectuer l'agrégation
     try:
-        df_grouped = df.groupby(available_cols, sort=False).agg(
-            agg_dict).reset_index()
         initial_rows = len(df)
+        # Comme le groupby sur toutes les colonnes, écarter les lignes ayant une valeur manquante
+        df = df.dropna(subset=available_cols)
+
+        # Les colonnes propres à l'établissement ne dépendent en principe que du
+        # SIRET : elles ne servent pas de clé (hachage coûteux) mais sont reprises
+        # de la première ligne. Si un SIRET a plusieurs graphies (nom, adresse...),
+        # toutes les colonnes redeviennent des clés pour ne fusionner aucune ligne
+        key_cols = available_cols
+        if 'SIRET' in available_cols:
+            siret_cols = [col for col in available_cols if col in SIRET_COLUMNS]
+            distinct = df[['SIRET'] + siret_cols].drop_duplicates()
+            inconsistent = distinct['SIRET'][distinct['SIRET'].duplicated()].nunique()
+            if inconsistent:
+                logger.warning(
+                    "%d SIRET avec des coordonnées client différentes selon les lignes : "
+                    "agrégation sur toutes les colonnes", inconsistent)
+            else:
+                key_cols = [col for col in available_cols if col not in SIRET_COLUMNS]
+        carried_cols = [col for col in available_cols if col not in key_cols]
+
+        # Créer le dictionnaire d'agrégation (somme pour toutes les colonnes numériques)
+        agg_dict = {col: 'first' for col in carried_cols}
+        agg_dict.update({col: 'sum' for col in available_agg_cols})
+
+        engine = get('defaults.groupby_engine')
+        if engine == 'sorted':
+            # Tri puis sommes par tranches, sans hachage des clés
+            df_grouped = _aggregate_sorted(df, key_cols, available_cols, available_agg_cols)
+        else:
+            grouped = df.groupby(key_cols, sort=False)
+            df_grouped = None
+            if engine == 'numba':
+                # Sommes compilées par numba (facultatif, compilation au premier appel)
+                try:
+                    sums = grouped[available_agg_cols].sum(
+                        engine='numba',
+                        engine_kwargs={'nopython': True, 'nogil': True, 'parallel': True})
+                    df_grouped = pd.concat([grouped[carried_cols].first(), sums], axis=1)
+                except ImportError:
+                    logger.warning("numba non installé : agrégation standard")
+            if df_grouped is None:
+                df_grouped = grouped.agg(agg_dict)
+            df_grouped = df_grouped.reset_index()[available_cols + available_agg_cols]
         final_rows = len(df_grouped)
         reduction = ((initial_rows - final_rows) /
                      initial_rows * 100) if initial_rows > 0 else 0
@@ -286,11 +646,12 @@ def aggregate_data(df: pd.DataFrame) -> pd.DataFrame:
             df_grouped['ANNEE'] = df_grouped['ANNEE'].fillna(0).astype(int)
 
         logger.info(
-            f"Données agrégées: {initial_rows} → {final_rows} lignes ({reduction:.1f}% de réduction)")
+            "Données agrégées: %s → %s lignes (%.1f%% de réduction)",
+            initial_rows, final_rows, reduction)
         return df_grouped
 
     except Exception as e:
-        logger.error(f"Erreur lors de l'agrégation des données: {str(e)}")
+        logger.error("Erreur lors de l'agrégation des données: %s", e)
         return df
 
 
@@ -306,24 +667,18 @@ def filter_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Filtrage des données selon les critères métier")
 
-    # Créer une copie pour éviter de modifier l'original
-    df_filtered = df.copy()
+    # Le filtrage produit un nouveau DataFrame : pas de copie préalable
+    df_filtered = df
     initial_rows = len(df_filtered)
 
-    # Filtrer les DIFFUS si la colonne existe
-    if 'CODE_REGROUPEMENT' in df_filtered.columns:
-        logger.info(
-            "Exclusion des enregistrements avec CODE_REGROUPEMENT = 'DIFFUS'")
-        df_filtered = df_filtered[df_filtered['CODE_REGROUPEMENT'] != 'DIFFUS']
-        diffus_removed = initial_rows - len(df_filtered)
-        logger.info(f"{diffus_removed} enregistrements 'DIFFUS' exclus")
+    # Les DIFFUS sont déjà exclus par clean_and_transform_data, avant l'agrégation
 
     # Vérifier s'il y a des SIRET manquants ou invalides
     if 'SIRET' in df_filtered.columns:
         missing_siret = df_filtered['SIRET'].isna().sum()
         if missing_siret > 0:
             logger.warning(
-                f"{missing_siret} enregistrements avec SIRET manquant")
+                "%s enregistrements avec SIRET manquant", missing_siret)
             # Option: filtrer les lignes sans SIRET
             # df_filtered = df_filtered[df_filtered['SIRET'].notna()]
 
@@ -332,7 +687,7 @@ def filter_data(df: pd.DataFrame) -> pd.DataFrame:
     final_rows = len(df_filtered)
     removed_rows = initial_rows - final_rows
     logger.info(
-        f"Filtrage terminé: {removed_rows} lignes supprimées, {final_rows} lignes conservées")
+        "Filtrage terminé: %s lignes supprimées, %s lignes conservées", removed_rows, final_rows)
 
     return df_filtered
 
@@ -341,6 +696,8 @@ def add_processing_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Ajoute les colonnes nécessaires au traitement par lots.
 
+    Le DataFrame reçu est modifié sur place (tri et nouvelles colonnes).
+
     Args:
         df (pd.DataFrame): Le DataFrame à enrichir
 
@@ -350,8 +707,8 @@ def add_processing_columns(df: pd.DataFrame) -> pd.DataFrame:
     logger.info(
         "Ajout des colonnes de traitement pour le regroupement par SIRET")
 
-    # Créer une copie pour éviter de modifier l'original
-    df_enhanced = df.copy()
+    # Le DataFrame reçu est trié et enrichi sur place
+    df_enhanced = df
 
     # Vérifier que la colonne SIRET existe
     if 'SIRET' not in df_enhanced.columns:
@@ -368,40 +725,71 @@ def add_processing_columns(df: pd.DataFrame) -> pd.DataFrame:
     if 'PRENOM' in df_enhanced.columns:
         sort_columns.append('PRENOM')
 
-    df_enhanced = df_enhanced.sort_values(by=sort_columns)
-    logger.info(f"Données triées par {', '.join(sort_columns)}")
+    # Le tri multi-colonnes de pandas travaille déjà sur les codes catégoriels
+    # des clés ; l'ordre obtenu est noté pour que la génération ne retrie pas
+    df_enhanced.sort_values(by=sort_columns, inplace=True)
+    df_enhanced.attrs['sorted_by'] = tuple(sort_columns)
+    logger.info("Données triées par %s", ', '.join(sort_columns))
+
+    # Une seule comparaison de chaque SIRET avec le suivant sert aux deux colonnes
+    # et aux deux comptes : chaque frontière ouvre un groupe et ferme le précédent
+    siret = df_enhanced['SIRET'].to_numpy()
+    boundaries = siret[1:] != siret[:-1]
+    edge = np.ones(min(len(siret), 1), dtype=np.int8)
+    boundaries = boundaries.view(np.int8)
+    group_count = int(np.count_nonzero(boundaries)) + len(edge)
 
     # Ajout de la colonne NOUVEAU_GROUPE (1 pour le premier employé de chaque SIRET, 0 pour les autres)
     logger.info("Ajout de la colonne NOUVEAU_GROUPE")
-    df_enhanced['NOUVEAU_GROUPE'] = (
-        df_enhanced['SIRET'] != df_enhanced['SIRET'].shift(1)).astype(int)
-    nouveau_count = df_enhanced['NOUVEAU_GROUPE'].sum()
-    logger.info(f"{nouveau_count} groupes SIRET identifiés")
+    df_enhanced['NOUVEAU_GROUPE'] = np.concatenate([edge, boundaries])
+    logger.info("%s groupes SIRET identifiés", group_count)
 
     # Ajout de la colonne FIN_GROUPE (1 pour le dernier employé de chaque SIRET, 0 pour les autres)
     logger.info("Ajout de la colonne FIN_GROUPE")
-    df_enhanced['FIN_GROUPE'] = (
-        df_enhanced['SIRET'] != df_enhanced['SIRET'].shift(-1)).astype(int)
-    fin_count = df_enhanced['FIN_GROUPE'].sum()
+    df_enhanced['FIN_GROUPE'] = np.concatenate([boundaries, edge])
 
-    # Vérification de cohérence
-    if nouveau_count != fin_count:
-        logger.warning(
-            f"Incohérence détectée: {nouveau_count} débuts de groupe ≠ {fin_count} fins de groupe")
-    else:
-        logger.info(
-            f"Vérification de cohérence OK: {nouveau_count} groupes SIRET bien identifiés")
+    # Vérification de cohérence : par construction, autant de débuts que de fins
+    logger.info(
+        "Vérification de cohérence OK: %s groupes SIRET bien identifiés", group_count)
 
     return df_enhanced
 
 
-def save_processed_data(df: pd.DataFrame, output_file: str) -> str:
+def _save_binary_copy(df: pd.DataFrame, output_file: str) -> None:
+    """
+    Écrit une copie binaire typée du CSV (Feather ou Parquet) pour accélérer sa relecture.
+
+    Le format est donné par defaults.intermediate_format. La copie est
+    facultative : sans pyarrow, seul le CSV est produit.
+
+    Args:
+        df (pd.DataFrame): Le DataFrame sauvegardé
+        output_file (str): Chemin du fichier CSV associé
+    """
+    fmt = get('defaults.intermediate_format', 'feather')
+    df = df.reset_index(drop=True)
+    try:
+        if fmt == 'parquet':
+            df.to_parquet(output_file + '.parquet', compression='zstd', index=False)
+        else:
+            df.to_feather(output_file + '.feather')
+    except ImportError:
+        logger.debug("pyarrow absent : pas de copie %s du CSV", fmt)
+    except Exception as e:
+        logger.warning("Copie %s du CSV non créée: %s", fmt, e)
+
+
+def save_processed_data(df: pd.DataFrame, output_file: str,
+                        output_format: str = 'auto') -> str:
     """
     Sauvegarde les données traitées dans un fichier CSV.
 
     Args:
         df (pd.DataFrame): Le DataFrame à sauvegarder
         output_file (str): Chemin vers le fichier de sortie
+        output_format (str): 'auto' (CSV + copie binaire, ou format déduit de
+            l'extension .parquet/.feather), 'csv' (CSV seul), 'parquet' ou
+            'feather' (fichier binaire seul)
 
     Returns:
         str: Chemin vers le fichier créé
@@ -410,40 +798,85 @@ def save_processed_data(df: pd.DataFrame, output_file: str) -> str:
     output_dir = os.path.dirname(output_file)
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir, exist_ok=True)
-        logger.info(f"Création du répertoire de sortie: {output_dir}")
+        logger.info("Création du répertoire de sortie: %s", output_dir)
 
     # Déterminer le séparateur à utiliser
     separator = get('defaults.csv_separator', ';')
 
-    logger.info(f"Sauvegarde des données traitées: {output_file}")
+    if output_format == 'auto':
+        output_format = os.path.splitext(output_file)[1].lstrip('.').lower()
+        if output_format not in ('parquet', 'feather'):
+            output_format = 'auto'
+
+    logger.info("Sauvegarde des données traitées: %s", output_file)
     try:
-        # Sauvegarde avec paramètres optimaux pour le publipostage
-        df.to_csv(
-            output_file,
-            index=False,
-            sep=separator,
-            quoting=csv.QUOTE_NONNUMERIC,
-            encoding='utf-8'
-        )
+        if output_format in ('parquet', 'feather'):
+            # Format binaire seul : relu directement par read_processed_csv
+            df = df.reset_index(drop=True)
+            if output_format == 'parquet':
+                df.to_parquet(output_file, compression='zstd', index=False)
+            else:
+                df.to_feather(output_file)
+            logger.info("Fichier %s créé: %s lignes", output_format, len(df))
+            return output_file
+
+        # Sauvegarde avec paramètres optimaux pour le publipostage : écriture
+        # par blocs dans un fichier temporaire à grand tampon, puis
+        # remplacement atomique pour ne jamais exposer un CSV partiel
+        tmp_file = output_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8', newline='',
+                  buffering=1 << 20) as fh:
+            df.to_csv(
+                fh,
+                index=False,
+                sep=separator,
+                quoting=csv.QUOTE_NONNUMERIC,
+                chunksize=50_000
+            )
+        os.replace(tmp_file, output_file)
+        if output_format == 'auto':
+            _save_binary_copy(df, output_file)
 
         # Vérification que le fichier a bien été créé
         if os.path.exists(output_file):
             file_size = os.path.getsize(output_file) / 1024  # Taille en Ko
             logger.info(
-                f"Fichier CSV créé avec succès: {len(df)} lignes, {file_size:.1f} Ko")
+                "Fichier CSV créé avec succès: %s lignes, %.1f Ko", len(df), file_size)
             return output_file
         else:
             logger.error(
-                f"Échec de vérification: le fichier {output_file} n'existe pas après sauvegarde")
+                "Échec de vérification: le fichier %s n'existe pas après sauvegarde", output_file)
             raise FileNotFoundError(
                 f"Le fichier {output_file} n'a pas été créé")
 
     except Exception as e:
-        logger.error(f"Erreur lors de la sauvegarde du fichier CSV: {str(e)}")
+        logger.error("Erreur lors de la sauvegarde du fichier CSV: %s", e)
         raise
 
 
-def nettoyer_fichier_excel(input_file: str, logger: logging.Logger, output_file: str = None, sheet_name: str = None) -> pd.DataFrame:
+def count_unique_sirets(df: pd.DataFrame) -> int:
+    """
+    Compte les SIRET distincts, en mémorisant le résultat dans df.attrs.
+
+    Le compte est conservé avec le nombre de lignes du DataFrame afin de
+    ne pas réutiliser une valeur obsolète après un filtrage.
+
+    Args:
+        df (pd.DataFrame): Le DataFrame traité
+
+    Returns:
+        int: Nombre de SIRET distincts
+    """
+    cached = df.attrs.get('nb_sirets')
+    if cached is not None and cached[0] == len(df):
+        return cached[1]
+    count = int(df['SIRET'].nunique())
+    df.attrs['nb_sirets'] = (len(df), count)
+    return count
+
+
+def nettoyer_fichier_excel(input_file: str, logger: logging.Logger, output_file: str = None, sheet_name: str = None,
+                           write_csv: bool = True) -> pd.DataFrame:
     """
     Fonction principale qui orchestre le traitement complet des données.
 
@@ -452,11 +885,13 @@ def nettoyer_fichier_excel(input_file: str, logger: logging.Logger, output_file:
         output_file (str, optional): Chemin vers le fichier CSV de sortie. Si None, génère un nom automatique.
         sheet_name (str, optional): Nom de la feuille à traiter. Si None, utilise celle de la configuration.
         logger (logging.Logger): Logger à utiliser pour les messages
+        write_csv (bool): Si False, aucun fichier n'est écrit : l'appelant utilise
+            directement le DataFrame retourné
 
     Returns:
         pd.DataFrame: Le DataFrame final traité
     """
-    logger.info(f"=== DÉBUT DU TRAITEMENT DU FICHIER: {input_file} ===")
+    logger.info("=== DÉBUT DU TRAITEMENT DU FICHIER: %s ===", input_file)
 
     # Générer un nom de fichier de sortie si non spécifié
     if output_file is None:
@@ -464,7 +899,7 @@ def nettoyer_fichier_excel(input_file: str, logger: logging.Logger, output_file:
         processed_dir = get('paths.processed_dir', './data/processed')
         os.makedirs(processed_dir, exist_ok=True)
         output_file = os.path.join(processed_dir, f"processed_{timestamp}.csv")
-        logger.info(f"Nom de fichier de sortie généré: {output_file}")
+        logger.info("Nom de fichier de sortie généré: %s", output_file)
 
     try:
         # ÉTAPE 1: Chargement des données
@@ -473,29 +908,89 @@ def nettoyer_fichier_excel(input_file: str, logger: logging.Logger, output_file:
 
         # ÉTAPE 2: Nettoyage et transformation
         logger.info("ÉTAPE 2: Nettoyage et transformation des données")
-        df_cleaned = clean_and_transform_data(df)
+        # Chaque étape remplace la précédente : les DataFrames intermédiaires
+        # sont libérés au fur et à mesure au lieu de rester en mémoire
+        df = clean_and_transform_data(df)
 
         # ÉTAPE 3: Agrégation des données
         logger.info("ÉTAPE 3: Agrégation des données")
-        df_grouped = aggregate_data(df_cleaned)
+        df = aggregate_data(df)
 
         # ÉTAPE 4: Filtrage des données
         logger.info("ÉTAPE 4: Filtrage des données")
-        df_filtered = filter_data(df_grouped)
+        df = filter_data(df)
 
         # ÉTAPE 5: Ajout des colonnes de traitement
         logger.info("ÉTAPE 5: Ajout des colonnes de traitement")
-        df_final = add_processing_columns(df_filtered)
+        df_final = add_processing_columns(df)
+        del df
 
         # ÉTAPE 6: Sauvegarde des données traitées
+        if not write_csv:
+            logger.info("ÉTAPE 6: Sauvegarde ignorée, données conservées en mémoire")
+            logger.info("=== TRAITEMENT TERMINÉ AVEC SUCCÈS ===")
+            return df_final
+
         logger.info("ÉTAPE 6: Sauvegarde des données traitées")
         save_processed_data(df_final, output_file)
 
         logger.info(
-            f"=== TRAITEMENT TERMINÉ AVEC SUCCÈS. FICHIER CRÉÉ: {output_file} ===")
+            "=== TRAITEMENT TERMINÉ AVEC SUCCÈS. FICHIER CRÉÉ: %s ===", output_file)
         return df_final
 
     except Exception as e:
-        logger.error(f"!!! ERREUR LORS DU TRAITEMENT DES DONNÉES: {str(e)}")
+        logger.error("!!! ERREUR LORS DU TRAITEMENT DES DONNÉES: %s", e)
         # Remonter l'exception pour qu'elle soit gérée au niveau supérieur
         raise
+
+
+def _nettoyer_fichier_worker(input_file: str, output_file: str) -> str:
+    """
+    Traite un fichier dans un processus séparé et retourne le chemin du CSV créé.
+
+    Le logger est obtenu dans le processus de travail : il n'est pas transmis
+    depuis le processus parent.
+    """
+    nettoyer_fichier_excel(input_file, get_logger(__name__), output_file)
+    return output_file
+
+
+def nettoyer_plusieurs_fichiers(files: List[str], max_workers: Optional[int] = None,
+                                output_dir: Optional[str] = None) -> List[str]:
+    """
+    Traite plusieurs fichiers Excel en parallèle, un processus par fichier.
+
+    Chaque fichier reçoit son propre CSV de sortie, numéroté selon sa position
+    dans la liste (processed_<n°>_<nom du fichier>_<horodatage>.csv) : deux
+    fichiers de même nom pris dans des dossiers différents, ou le même fichier
+    donné deux fois, n'écrivent jamais au même endroit.
+
+    Args:
+        files (List[str]): Chemins des fichiers Excel source
+        max_workers (int, optional): Nombre de processus. Si None, un par cœur (au plus un par fichier).
+        output_dir (str, optional): Dossier des CSV. Si None, celui des données traitées de la configuration.
+
+    Returns:
+        List[str]: Chemins des CSV créés, dans l'ordre des fichiers source
+    """
+    if not files:
+        return []
+
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    if output_dir is None:
+        output_dir = get('paths.processed_dir', './data/processed')
+    os.makedirs(output_dir, exist_ok=True)
+    output_files = [
+        os.path.join(output_dir, f"processed_{index:03d}_{Path(f).stem}_{timestamp}.csv")
+        for index, f in enumerate(files, 1)
+    ]
+
+    if max_workers is None:
+        max_workers = min(len(files), os.cpu_count() or 1)
+    logger.info("Traitement de %d fichiers sur %d processus", len(files), max_workers)
+
+    # Processus démarrés par spawn comme sous Windows : un fork hériterait des
+    # threads déjà lancés par numba ou pyarrow et pourrait rester bloqué
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(_nettoyer_fichier_worker, files, output_files))
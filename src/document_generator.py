@@ -6,12 +6,18 @@ Ce module gère la création des attestations DOETH au format Word et/ou PDF
 """
 import csv
 import logging
+import logging.handlers
+import multiprocessing
+import numbers
 import os
 import tempfile
 import datetime
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Callable, Iterable
 
 import pandas as pd
 from docx import Document
@@ -36,6 +42,17 @@ class OutputFormat(Enum):
     BOTH = "both"
 
 
+@lru_cache(maxsize=32)
+def _resource_exists(path: Optional[str]) -> bool:
+    """
+    Indique si une image (logo, signature) existe, en mémorisant la réponse.
+
+    Le cache est vidé au début de chaque génération : les fichiers ne sont
+    testés qu'une fois par lot d'attestations.
+    """
+    return bool(path) and os.path.exists(path)
+
+
 def create_document(template_path: Optional[str] = None) -> Document:
     """
     Crée un nouveau document Word avec les paramètres par défaut.
@@ -46,10 +63,10 @@ def create_document(template_path: Optional[str] = None) -> Document:
     Returns:
         Document: Document Word initialisé
     """
-    logger.debug(f"Création d'un nouveau document Word")
+    logger.debug("Création d'un nouveau document Word")
 
     if template_path and os.path.exists(template_path):
-        logger.debug(f"Utilisation du modèle: {template_path}")
+        logger.debug("Utilisation du modèle: %s", template_path)
         doc = Document(template_path)
     else:
         doc = Document()
@@ -82,13 +99,13 @@ def add_logo(doc: Document, logo_path: Optional[str] = None) -> None:
         doc: Document Word à modifier
         logo_path: Chemin vers l'image du logo
     """
-    if not logo_path or not os.path.exists(logo_path):
+    if not _resource_exists(logo_path):
         logo_path = get('resources.logo_path')
-        if not logo_path or not os.path.exists(logo_path):
+        if not _resource_exists(logo_path):
             logger.warning("Logo non trouvé, en-tête non ajouté")
             return
 
-    logger.debug(f"Ajout du logo: {logo_path}")
+    logger.debug("Ajout du logo: %s", logo_path)
 
     p = doc.add_paragraph()
     p.alignment = WD_ALIGN_PARAGRAPH.LEFT
@@ -254,6 +271,26 @@ def add_client_attestation(doc: Document, client_info: Dict[str, Any]) -> None:
     p = doc.add_paragraph(explanation_text)
 
 
+def _format_number(value: Any) -> str:
+    """
+    Affiche une valeur numérique du tableau comme après un aller-retour par le CSV.
+
+    Les sommes de l'agrégation peuvent porter un bruit d'arrondi
+    (123.82000000000001) : la valeur est ramenée à 15 chiffres significatifs,
+    puis affichée comme un flottant (1 -> '1.0'), quelle que soit sa source
+    (DataFrame en mémoire, CSV ou copie binaire). Le texte est laissé tel quel.
+
+    Args:
+        value: Valeur de la cellule
+
+    Returns:
+        str: Texte à afficher
+    """
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        return str(float(f"{value:.15g}"))
+    return str(value)
+
+
 def create_employee_table(doc: Document, employees_data: pd.DataFrame) -> None:
     """
     Crée et remplit le tableau des employés.
@@ -262,7 +299,7 @@ def create_employee_table(doc: Document, employees_data: pd.DataFrame) -> None:
         doc: Document Word à modifier
         employees_data: DataFrame contenant les données des employés
     """
-    logger.debug(f"Création du tableau pour {len(employees_data)} employés")
+    logger.debug("Création du tableau pour %s employés", len(employees_data))
 
     doc.add_paragraph()
     table = doc.add_table(rows=1, cols=8)
@@ -305,9 +342,9 @@ def create_employee_table(doc: Document, employees_data: pd.DataFrame) -> None:
         row_cells[3].text = str(row['NOM']) if row['NOM'] == row['NOM'] else ''
         row_cells[4].text = str(
             row['QUALIFICATION']) if row['QUALIFICATION'] == row['QUALIFICATION'] else ''
-        row_cells[5].text = str(
+        row_cells[5].text = _format_number(
             row['ETP_MAJORE']) if row['ETP_MAJORE'] == row['ETP_MAJORE'] else ''
-        row_cells[6].text = str(
+        row_cells[6].text = _format_number(
             row['NB_HEURES']) if row['NB_HEURES'] == row['NB_HEURES'] else ''
         row_cells[7].text = f"{float(row['ETP_ANNUEL']):.2f}" if row['ETP_ANNUEL'] == row['ETP_ANNUEL'] else ''
 
@@ -378,13 +415,13 @@ def add_footer_and_signature(doc: Document, signature_path: Optional[str] = None
     add_empty_space(doc)
 
     # Ajouter la signature si fournie
-    if not signature_path or not os.path.exists(signature_path):
+    if not _resource_exists(signature_path):
         signature_path = get('resources.signature_path')
-        if not signature_path or not os.path.exists(signature_path):
+        if not _resource_exists(signature_path):
             logger.warning("Image de signature non trouvée")
             return
 
-    logger.debug(f"Ajout de la signature: {signature_path}")
+    logger.debug("Ajout de la signature: %s", signature_path)
 
     p = doc.add_paragraph()
     p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
@@ -409,13 +446,13 @@ def save_document(doc: Document, output_path: str) -> str:
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir, exist_ok=True)
 
-    logger.debug(f"Sauvegarde du document: {output_path}")
+    logger.debug("Sauvegarde du document: %s", output_path)
     try:
         doc.save(output_path)
-        logger.info(f"Document enregistré: {output_path}")
+        logger.info("Document enregistré: %s", output_path)
         return output_path
     except Exception as e:
-        logger.error(f"Erreur lors de l'enregistrement du document: {str(e)}")
+        logger.error("Erreur lors de l'enregistrement du document: %s", e)
         raise
 
 
@@ -454,8 +491,8 @@ def create_attestation(file_number: int, siret_data: pd.DataFrame, output_folder
     nom_client = info['NOM_CLIENT']
     nom_regroupement = info['REGROUPEMENT']
 
-    logger.info(f"Création de l'attestation pour SIRET: {siret}, Client: {nom_client}, "
-                f"Nom du regroupement: {nom_regroupement}")
+    logger.info("Création de l'attestation pour SIRET: %s, Client: %s, "
+                "Nom du regroupement: %s", siret, nom_client, nom_regroupement)
 
     # Construction du document Word
     doc = create_document()
@@ -491,7 +528,7 @@ def create_attestation(file_number: int, siret_data: pd.DataFrame, output_folder
                 docx_path.unlink()
             except OSError as e:
                 logger.warning(
-                    f"Impossible de supprimer le DOCX intermédiaire: {e}")
+                    "Impossible de supprimer le DOCX intermédiaire: %s", e)
 
     return generated
 
@@ -511,7 +548,7 @@ def _convert_to_pdf(docx_path: Path, logger: logging.Logger) -> Optional[Path]:
     try:
         from docx2pdf import convert
         convert(str(docx_path), str(pdf_path))
-        logger.debug(f"PDF généré: {pdf_path}")
+        logger.debug("PDF généré: %s", pdf_path)
         return pdf_path
     except ImportError:
         logger.error(
@@ -519,17 +556,133 @@ def _convert_to_pdf(docx_path: Path, logger: logging.Logger) -> Optional[Path]:
         return None
     except Exception as e:
         logger.error(
-            f"Erreur lors de la conversion PDF pour {docx_path.name}: {e}")
+            "Erreur lors de la conversion PDF pour %s: %s", docx_path.name, e)
         return None
 
 
-def generer_attestations_doeth(csv_path: str, output_folder: str,
-                               logger: logging.Logger,
-                               signature_path: Optional[str] = None,
-                               logo_path: Optional[str] = None,
-                               output_format: OutputFormat = OutputFormat.DOCX) -> List[str]:
+# Colonnes texte à faible cardinalité, chargées en catégories
+CATEGORY_COLUMNS = ('REGROUPEMENT', 'NOM_CLIENT')
+
+
+# Lecteurs des copies binaires du CSV intermédiaire, par extension
+_BINARY_READERS = {'.parquet': pd.read_parquet, '.feather': pd.read_feather}
+
+
+def _read_binary_copy(path: str) -> pd.DataFrame:
     """
-    Génère des attestations DOETH regroupées par SIRET à partir d'un fichier CSV.
+    Lit une copie Parquet ou Feather avec les mêmes types que la relecture du CSV.
+
+    Comme avec QUOTE_NONNUMERIC, les nombres sont en float64 et le texte en
+    object, les chaînes vides devenant des valeurs manquantes : les
+    attestations ne dépendent pas de la source utilisée.
+    """
+    reader = _BINARY_READERS[os.path.splitext(path)[1]]
+    df = reader(path)
+    for col in df.columns:
+        dtype = df[col].dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+        if pd.api.types.is_numeric_dtype(dtype):
+            df[col] = df[col].astype('float64')
+        elif pd.api.types.is_string_dtype(dtype):
+            values = df[col].to_numpy(dtype=object, na_value=float('nan'))
+            values[values == ''] = float('nan')
+            df[col] = values
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+def read_processed_csv(csv_path: str) -> pd.DataFrame:
+    """
+    Charge le fichier CSV intermédiaire produit par le traitement des données.
+
+    Un fichier .parquet ou .feather est lu directement. Pour un CSV, la copie
+    binaire écrite à côté par le traitement est préférée si elle n'est pas
+    plus ancienne que le CSV ; à défaut, le CSV est lu par l'analyseur C de
+    pandas (le moteur pyarrow ne sait pas appliquer QUOTE_NONNUMERIC).
+
+    Args:
+        csv_path: Chemin vers le fichier traité (CSV, Parquet ou Feather)
+
+    Returns:
+        pd.DataFrame: Les données, avec SIRET, SIREN et NIC conservés en texte
+        et les colonnes de regroupement en catégories
+    """
+    if csv_path.endswith(tuple(_BINARY_READERS)):
+        return _read_binary_copy(csv_path)
+
+    for suffix in _BINARY_READERS:
+        try:
+            if os.path.getmtime(csv_path + suffix) >= os.path.getmtime(csv_path):
+                return _read_binary_copy(csv_path + suffix)
+        except (ImportError, OSError, ValueError):
+            pass
+
+    separator = get('defaults.csv_separator', ';')
+    dtypes = {'SIRET': str, 'SIREN': str, 'NIC': str}
+    dtypes.update(dict.fromkeys(CATEGORY_COLUMNS, 'category'))
+    # Analyseur C uniquement : seul il applique QUOTE_NONNUMERIC (champs non
+    # cités lus en nombres, champs cités gardés en texte). Le moteur pyarrow
+    # ignore les guillemets pour déduire les types : un champ texte fait de
+    # chiffres y devient un nombre et les colonnes n'ont pas les mêmes types
+    # selon que pyarrow est installé ou non. Il n'est donc pas utilisé ici ;
+    # la relecture rapide passe par la copie Feather/Parquet ci-dessus.
+    # Lecture d'un seul tenant : la génération regroupe par SIRET sur tout le fichier
+    return pd.read_csv(csv_path, sep=separator, quoting=csv.QUOTE_NONNUMERIC,
+                       dtype=dtypes, memory_map=True)
+
+
+class _ForwardToLogger(logging.Handler):
+    """Transmet un enregistrement reçu d'un processus de travail au logger du même nom."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker_logging(queue: Any, level: int) -> None:
+    """
+    Initialise la journalisation d'un processus de travail.
+
+    Les messages sont envoyés dans la file du processus parent, qui les
+    transmet à ses propres handlers (console, fichier, interface). Les
+    processus sont démarrés par spawn : ils n'héritent d'aucun handler du
+    parent, seul le logger racine est configuré.
+    """
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(queue))
+    root.setLevel(level)
+
+
+def _bounded_map(executor: ProcessPoolExecutor, fn: Callable, *iterables: Iterable,
+                 window: int) -> Iterator[Any]:
+    """
+    Comme executor.map, mais avec au plus `window` tâches soumises à la fois.
+
+    Les données (un DataFrame par SIRET) ne sont ainsi sérialisées qu'au fur
+    et à mesure, et non toutes dès le départ ; l'ordre des résultats est conservé.
+    """
+    pending = deque()
+    for args in zip(*iterables):
+        pending.append(executor.submit(fn, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def iter_attestations_doeth(csv_path: str, output_folder: str,
+                            logger: logging.Logger,
+                            signature_path: Optional[str] = None,
+                            logo_path: Optional[str] = None,
+                            output_format: OutputFormat = OutputFormat.DOCX,
+                            df: Optional[pd.DataFrame] = None) -> Iterator[List[str]]:
+    """
+    Génère les attestations DOETH une à une, au fil des SIRET.
+
+    Chaque itération renvoie les fichiers produits pour un SIRET dès leur
+    écriture, ce qui permet à l'appelant de suivre l'avancement.
 
     Args:
         csv_path: Chemin vers le fichier CSV source
@@ -538,9 +691,10 @@ def generer_attestations_doeth(csv_path: str, output_folder: str,
         signature_path: Chemin vers l'image de signature
         logo_path: Chemin vers l'image du logo
         output_format: Format de sortie (DOCX, PDF ou BOTH)
+        df: Données déjà chargées (évite une nouvelle lecture du CSV)
 
-    Returns:
-        List[str]: Liste des chemins des fichiers générés
+    Yields:
+        List[str]: Chemins des fichiers générés pour un SIRET
     """
     format_label = {
         OutputFormat.DOCX: "Word (.docx)",
@@ -549,43 +703,97 @@ def generer_attestations_doeth(csv_path: str, output_folder: str,
     }[output_format]
 
     logger.info(
-        f"Génération des attestations ({format_label}) depuis: {csv_path}")
+        "Génération des attestations (%s) depuis: %s", format_label, csv_path)
     os.makedirs(output_folder, exist_ok=True)
+    _resource_exists.cache_clear()
 
+    executor = None
+    listener = None
     try:
-        separator = get('defaults.csv_separator', ';')
-        df = pd.read_csv(csv_path, sep=separator, quoting=csv.QUOTE_NONNUMERIC,
-                         dtype={'SIRET': str, 'SIREN': str, 'NIC': str})
-        logger.info(f"Fichier CSV chargé: {len(df)} lignes")
-
-        df = df.sort_values(by=['SIRET', 'NOM', 'PRENOM'])
-        sirets = df['SIRET'].unique()
-        logger.info(f"Nombre total de SIRET à traiter: {len(sirets)}")
-
-        generated_docs: List[str] = []
-
-        for i, siret in enumerate(sirets):
-            siret_data = df[df['SIRET'] == siret]
-            if len(siret_data) == 0:
-                logger.warning(f"Aucune donnée pour le SIRET: {siret}")
-                continue
-
-            files = create_attestation(
-                i + 1, siret_data, output_folder, logger,
-                signature_path, logo_path, output_format)
-            generated_docs.extend(files)
-
+        if df is None:
+            df = read_processed_csv(csv_path)
+            logger.info("Fichier CSV chargé: %s lignes", len(df))
+
+        # Données issues de add_processing_columns : déjà triées dans cet ordre
+        if df.attrs.get('sorted_by') != ('SIRET', 'NOM', 'PRENOM'):
+            df = df.sort_values(by=['SIRET', 'NOM', 'PRENOM'])
+        # Colonne extraite une seule fois pour toutes les sélections par SIRET
+        siret_values = df['SIRET'].to_numpy()
+        sirets = pd.unique(siret_values)
+        logger.info("Nombre total de SIRET à traiter: %s", len(sirets))
+
+        # Les attestations sont indépendantes : elles peuvent être réparties
+        # sur plusieurs processus (defaults.parallel_workers, 1 par défaut)
+        render = partial(
+            create_attestation, output_folder=output_folder, logger=logger,
+            signature_path=signature_path, logo_path=logo_path,
+            output_format=output_format)
+        file_numbers = range(1, len(sirets) + 1)
+        frames = (df[siret_values == siret] for siret in sirets)
+        workers = min(int(get('defaults.parallel_workers', 1) or 1), len(sirets))
+        if workers > 1:
+            logger.info("Génération répartie sur %s processus", workers)
+            # Processus démarrés par spawn sur toutes les plateformes, comme sous
+            # Windows : pas de handlers ni de threads hérités d'un fork. Leurs
+            # messages reviennent par une file
+            context = multiprocessing.get_context('spawn')
+            log_queue = context.Queue()
+            listener = logging.handlers.QueueListener(log_queue, _ForwardToLogger())
+            listener.start()
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=context, initializer=_init_worker_logging,
+                initargs=(log_queue, logger.getEffectiveLevel()))
+            results = _bounded_map(executor, render, file_numbers, frames, window=workers * 4)
+        else:
+            results = map(render, file_numbers, frames)
+
+        for i, files in enumerate(results):
             # Barre de progression
             progress = (i + 1) / len(sirets)
             filled = int(30 * progress)
             bar = '█' * filled + '░' * (30 - filled)
             logger.info(
-                f"({i + 1}/{len(sirets)}) [{bar}] {progress:.1%}: {', '.join(Path(f).name for f in files)}")
-
-        logger.info(
-            f"Génération terminée: {len(generated_docs)} fichier(s) dans {output_folder}")
-        return generated_docs
+                "(%s/%s) [%s] %.1f%%: %s", i + 1, len(sirets), bar, progress * 100,
+                ', '.join(Path(f).name for f in files))
+            yield files
 
     except Exception as e:
-        logger.error(f"Erreur lors de la génération des attestations: {e}")
+        logger.error("Erreur lors de la génération des attestations: %s", e)
         raise
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if listener is not None:
+            listener.stop()
+
+
+def generer_attestations_doeth(csv_path: str, output_folder: str,
+                               logger: logging.Logger,
+                               signature_path: Optional[str] = None,
+                               logo_path: Optional[str] = None,
+                               output_format: OutputFormat = OutputFormat.DOCX,
+                               df: Optional[pd.DataFrame] = None) -> List[str]:
+    """
+    Génère des attestations DOETH regroupées par SIRET à partir d'un fichier CSV.
+
+    Args:
+        csv_path: Chemin vers le fichier CSV source
+        output_folder: Dossier où enregistrer les attestations
+        logger: Logger pour suivre l'évolution des opérations
+        signature_path: Chemin vers l'image de signature
+        logo_path: Chemin vers l'image du logo
+        output_format: Format de sortie (DOCX, PDF ou BOTH)
+        df: Données déjà chargées (évite une nouvelle lecture du CSV)
+
+    Returns:
+        List[str]: Liste des chemins des fichiers générés
+    """
+    generated_docs: List[str] = []
+    for files in iter_attestations_doeth(csv_path, output_folder, logger,
+                                         signature_path, logo_path,
+                                         output_format, df):
+        generated_docs.extend(files)
+
+    logger.info(
+        "Génération terminée: %s fichier(s) dans %s", len(generated_docs), output_folder)
+    return generated_docs
@@ -53,7 +53,7 @@ class WordPDFConverter:
                 self._word.Quit()
                 logger.debug("Instance Word COM fermée")
             except Exception as e:
-                logger.warning(f"Erreur lors de la fermeture de Word : {e}")
+                logger.warning("Erreur lors de la fermeture de Word : %s", e)
         # Ne pas supprimer l'exception — la laisser remonter
         return False
 
@@ -81,7 +81,7 @@ class WordPDFConverter:
         try:
             doc = self._word.Documents.Open(str(docx_path))
             doc.SaveAs(str(pdf_path), FileFormat=_WD_FORMAT_PDF)
-            logger.debug(f"PDF généré : {pdf_path.name}")
+            logger.debug("PDF généré : %s", pdf_path.name)
             return pdf_path
         except Exception as e:
             raise RuntimeError(
@@ -116,7 +116,7 @@ def convert_batch(
     if not docx_paths:
         return pdf_paths
 
-    log.info(f"Conversion PDF : {len(docx_paths)} fichier(s) à traiter")
+    log.info("Conversion PDF : %s fichier(s) à traiter", len(docx_paths))
 
     with WordPDFConverter() as converter:
         for docx_path in docx_paths:
@@ -126,11 +126,11 @@ def convert_batch(
 
                 if delete_docx:
                     Path(docx_path).unlink(missing_ok=True)
-                    log.debug(f"DOCX supprimé : {Path(docx_path).name}")
+                    log.debug("DOCX supprimé : %s", Path(docx_path).name)
 
             except Exception as e:
-                log.error(f"Erreur conversion {Path(docx_path).name} : {e}")
+                log.error("Erreur conversion %s : %s", Path(docx_path).name, e)
 
     log.info(
-        f"Conversion PDF terminée : {len(pdf_paths)}/{len(docx_paths)} succès")
+        "Conversion PDF terminée : %s/%s succès", len(pdf_paths), len(docx_paths))
     return pdf_paths
@@ -44,6 +44,10 @@ class Config:
         # Résoudre les références de type ${...}
         self._resolve_references(self.config)
 
+        # Cache des valeurs déjà résolues par get()
+        self._cache: Dict[str, Any] = {}
+        self._environment: Optional[Tuple[str, Path]] = None
+
     def get_environment(self) -> Tuple[str, Path]:
         """
         Détermine l'environnement d'exécution et le fichier de configuration associé.
@@ -51,13 +55,16 @@ class Config:
         Returns:
             Tuple[str, Path]: Nom de l'environnement et chemin vers le fichier de configuration associé
         """
-        hostname = platform.node().upper()
-        env_mapping = {
-            "FRDC1SRVREBP01": ("PRODUCTION", ".env.prod"),
-            "RN-SIEGE787": ("DÉVELOPPEMENT", ".env.develop")
-        }
-        env_name, env_file = env_mapping.get(hostname, ("TEST", ".env.test"))
-        return env_name, Path(__file__).parent.parent.parent / "config" / env_file
+        if self._environment is None:
+            hostname = platform.node().upper()
+            env_mapping = {
+                "FRDC1SRVREBP01": ("PRODUCTION", ".env.prod"),
+                "RN-SIEGE787": ("DÉVELOPPEMENT", ".env.develop")
+            }
+            env_name, env_file = env_mapping.get(hostname, ("TEST", ".env.test"))
+            self._environment = (
+                env_name, Path(__file__).parent.parent.parent / "config" / env_file)
+        return self._environment
 
     @staticmethod
     def get_log_level(env_name: str) -> int:
@@ -128,7 +135,10 @@ class Config:
         Returns:
             Any: Valeur de configuration ou valeur par défaut
         """
-        value = self._get_nested_value(path)
+        try:
+            value = self._cache[path]
+        except KeyError:
+            value = self._cache[path] = self._get_nested_value(path)
         return value if value is not None else default
 
 
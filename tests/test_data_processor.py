@@ -0,0 +1,242 @@
+"""
+Tests du traitement des données DOETH.
+"""
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.data_processor as data_processor
+from src.data_processor import (AGG_COLUMNS, GROUP_COLUMNS, _concat_codes, _format_dates_dmy, _is_ascii_digits,
+                                add_processing_columns, aggregate_data,
+                                clean_and_transform_data, create_siret_column,
+                                filter_data, load_excel_data, nettoyer_plusieurs_fichiers,
+                                save_processed_data)
+
+# Sortie CSV produite par la version de référence pour raw_df
+EXPECTED_CSV = os.linesep.join([
+    '"CODE_REGROUPEMENT";"REGROUPEMENT";"SIREN";"NIC";"SIRET";"NOM_CLIENT";"ADRESSE_CLIENT";"CP_CLIENT";"VILLE_CLIENT";"APE";"NOM";"PRENOM";"DATE_NAISSANCE";"ANNEE";"QUALIFICATION";"ETP_MAJORE";"ETP_ANNUEL";"NB_HEURES";"NOUVEAU_GROUPE";"FIN_GROUPE"',
+    '"R1";"Regroupement A";"012345678";"00012";"01234567800012";"Client A";"1 rue A";35000;"Rennes";"7010Z";"DUPONT";"Jean";"17/05/1980";2023;"Employé";1.0;0.6;123.82;1;0',
+    '"R1";"Regroupement A";"012345678";"00012";"01234567800012";"Client A";"1 rue A";35000;"Rennes";"7010Z";"MARTIN";"Anne";"15/03/1975";2023;"Cadre";1.5;0.6;92.26;0;1',
+    '"R4";"Regroupement D";"1234567890";"00001";"123456789000001";"Client Z";"5 r Z";35000;"Rennes";"0000Z";"Z";"W";"";2023;"Employé";1.0;0.2;0.0;1;1',
+    '"R2";"Regroupement B";"987654321";"00034";"98765432100034";"Client B";"2 av B";44000;"Nantes";"4711D";"BERNARD";"Luc";"02/01/1990";2023;"Ouvrier";1.0;1.0;151.67;1;1',
+    '',
+]).encode('utf-8')
+
+
+@pytest.fixture
+def raw_df():
+    """Extraction Excel brute : SIREN court, invalide et trop long, dates mixtes, DIFFUS."""
+    return pd.DataFrame({
+        'CODE_REGROUPEMENT': ['R1', 'R1', 'R1', 'R1', 'R2', 'DIFFUS', 'R3', 'R4'],
+        'REGROUPEMENT': ['Regroupement A'] * 4 + ['Regroupement B', 'Diffus', 'Regroupement C', 'Regroupement D'],
+        'SIREN': ['12345678', '12345678', '12345678', '12345678', '987654321', '111111111', 'ABC', '1234567890'],
+        'NIC': ['12', '12', '12', '12', '00034', '1', '1', '1'],
+        'NOM_CLIENT': ['Client A'] * 4 + ['Client B', 'Client D', 'Client X', 'Client Z'],
+        'ADRESSE_CLIENT': ['1 rue A'] * 4 + ['2 av B', '3 bd D', '4 r X', '5 r Z'],
+        'CP_CLIENT': [35000, 35000, 35000, 35000, 44000, 75001, 35000, 35000],
+        'VILLE_CLIENT': ['Rennes'] * 4 + ['Nantes', 'Paris', 'Rennes', 'Rennes'],
+        'APE': ['7010Z'] * 4 + ['4711D', '1234A', '0000Z', '0000Z'],
+        'NOM': ['DUPONT', 'DUPONT', 'MARTIN', 'MARTIN', 'BERNARD', 'DURAND', 'X', 'Z'],
+        'PRENOM': ['Jean', 'Jean', 'Anne', 'Anne', 'Luc', 'Paul', 'Y', 'W'],
+        'DATE_NAISSANCE': [datetime.datetime(1980, 5, 17)] * 2 + ['15/03/1975'] * 2
+                          + [datetime.datetime(1990, 1, 2), datetime.datetime(1985, 7, 7),
+                             datetime.datetime(1970, 1, 1), None],
+        'ANNEE': [2023] * 8,
+        'QUALIFICATION': ['Employé', 'Employé', 'Cadre', 'Cadre', 'Ouvrier', 'Employé', 'Employé', 'Employé'],
+        'ETP_MAJORE': [1, 1, 1.5, 1.5, 1, 1, 1, 1],
+        'ETP_ANNUEL': [0.25, 0.35, 0.5, 0.1, 1, 0.2, 0.2, 0.2],
+        'NB_HEURES': [100.1, 23.72, 92.25, 0.01, 151.67, 10, 10, np.nan],
+    })
+
+
+def _use_engine(monkeypatch, engine: str) -> None:
+    config_get = data_processor.get
+    monkeypatch.setattr(
+        data_processor, 'get',
+        lambda key, default=None: engine if key == 'defaults.groupby_engine' else config_get(key, default))
+
+
+def _use_config(monkeypatch, **values) -> None:
+    config_get = data_processor.get
+    monkeypatch.setattr(
+        data_processor, 'get',
+        lambda key, default=None: values.get(key.rsplit('.', 1)[-1], config_get(key, default)))
+
+
+def _write_workbook(df: pd.DataFrame, path, sheet_name: str = 'Feuil1') -> str:
+    df.to_excel(path, sheet_name=sheet_name, index=False)
+    return str(path)
+
+
+def _process(df: pd.DataFrame) -> pd.DataFrame:
+    df = aggregate_data(clean_and_transform_data(df))
+    return add_processing_columns(filter_data(df))
+
+
+def test_siret_concatenation_with_invalid_and_overlong_codes(raw_df):
+    df = create_siret_column(raw_df)
+
+    # 'ABC' est exclu, le SIREN trop long est conservé tel quel
+    assert 'ABC' not in ''.join(df['SIREN'])
+    assert df['SIRET'].tolist() == ['01234567800012'] * 4 + [
+        '98765432100034', '11111111100001', '123456789000001']
+    assert df['NIC'].tolist() == ['00012'] * 4 + ['00034', '00001', '00001']
+
+
+def test_siret_from_numeric_codes_keeps_leading_zeros():
+    df = create_siret_column(pd.DataFrame({
+        'SIREN': pd.array([12345678, 987654321], dtype='int64'),
+        'NIC': pd.array([12, 34], dtype='int64'),
+    }))
+
+    assert df['SIRET'].tolist() == ['01234567800012', '98765432100034']
+    assert df['SIREN'].tolist() == ['012345678', '987654321']
+    assert df['NIC'].tolist() == ['00012', '00034']
+
+
+def test_concat_codes_matches_string_concatenation():
+    siren = np.array(['012345678', '987654321'])
+    nic = np.array(['00012', '00034'])
+    assert _concat_codes(siren, nic).tolist() == ['01234567800012', '98765432100034']
+
+    # Largeurs différentes : concaténation générique
+    siren = np.array(['012345678', '1234567890'])
+    assert _concat_codes(siren, nic).tolist() == ['01234567800012', '123456789000034']
+
+    assert _is_ascii_digits(np.array(['012345678', '000000ABC', '１２３'])).tolist() == [True, False, False]
+
+
+@pytest.mark.parametrize('engine', ['numba', 'sorted'])
+def test_groupby_engines_match_cython(raw_df, monkeypatch, engine):
+    if engine == 'numba':
+        pytest.importorskip('numba')
+    _use_engine(monkeypatch, 'cython')
+    expected = _process(raw_df.copy())
+
+    _use_engine(monkeypatch, engine)
+    result = _process(raw_df.copy())
+
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True))
+
+
+@pytest.mark.parametrize('engine', ['cython', 'numba', 'sorted'])
+def test_aggregation_keeps_lines_of_a_siret_with_different_addresses(raw_df, monkeypatch, engine):
+    if engine == 'numba':
+        pytest.importorskip('numba')
+    _use_engine(monkeypatch, engine)
+    raw_df.loc[1, 'ADRESSE_CLIENT'] = '1 rue A bis'
+    cleaned = clean_and_transform_data(raw_df)
+
+    result = aggregate_data(cleaned.copy())
+
+    # Même résultat qu'un regroupement sur toutes les colonnes
+    expected = cleaned.dropna(subset=GROUP_COLUMNS).groupby(
+        GROUP_COLUMNS, sort=False)[AGG_COLUMNS].sum().reset_index()
+    pd.testing.assert_frame_equal(
+        result.sort_values(GROUP_COLUMNS).reset_index(drop=True),
+        expected.sort_values(GROUP_COLUMNS).reset_index(drop=True))
+    dupont = result[result['NOM'] == 'DUPONT'].sort_values('ADRESSE_CLIENT')
+    assert dupont['ADRESSE_CLIENT'].tolist() == ['1 rue A', '1 rue A bis']
+    assert dupont['NB_HEURES'].tolist() == [100.1, 23.72]
+
+
+def test_format_dates_dmy_with_missing_values():
+    dates = pd.Series(pd.to_datetime([
+        datetime.datetime(1980, 5, 17), None, datetime.datetime(2000, 12, 1),
+        datetime.datetime(1905, 1, 31)]))
+    assert _format_dates_dmy(dates).tolist() == ['17/05/1980', '', '01/12/2000', '31/01/1905']
+    assert _format_dates_dmy(dates).tolist() == dates.dt.strftime('%d/%m/%Y').fillna('').tolist()
+
+
+@pytest.mark.parametrize('string_dtype', [object, 'string[pyarrow]'])
+def test_csv_output_matches_reference(raw_df, tmp_path, string_dtype):
+    if string_dtype != object:
+        pytest.importorskip('pyarrow')
+        text_columns = raw_df.columns[raw_df.dtypes == object].drop('DATE_NAISSANCE')
+        raw_df[text_columns] = raw_df[text_columns].astype(string_dtype)
+    output_file = tmp_path / 'donnees_traitees.csv'
+
+    save_processed_data(_process(raw_df), str(output_file), output_format='csv')
+
+    assert output_file.read_bytes() == EXPECTED_CSV
+
+
+@pytest.fixture
+def excel_cache(raw_df, tmp_path, monkeypatch):
+    """Classeur d'exemple avec le cache Parquet activé dans un répertoire temporaire."""
+    pytest.importorskip('pyarrow')
+    _use_config(monkeypatch, excel_cache=True, processed_dir=str(tmp_path / 'processed'))
+    workbook = _write_workbook(raw_df, tmp_path / 'donnees.xlsx')
+    read_excel = pd.read_excel
+    calls = []
+
+    def counting_read_excel(*args, **kwargs):
+        calls.append(args[0])
+        return read_excel(*args, **kwargs)
+
+    monkeypatch.setattr(pd, 'read_excel', counting_read_excel)
+    return workbook, tmp_path / 'processed' / 'cache', calls
+
+
+def test_excel_cache_is_disabled_by_default(raw_df, tmp_path, monkeypatch):
+    _use_config(monkeypatch, processed_dir=str(tmp_path / 'processed'))
+
+    load_excel_data(_write_workbook(raw_df, tmp_path / 'donnees.xlsx'), 'Feuil1')
+
+    assert not (tmp_path / 'processed').exists()
+
+
+def test_excel_cache_hit_skips_workbook(excel_cache):
+    workbook, cache_dir, calls = excel_cache
+
+    first = load_excel_data(workbook, 'Feuil1')
+    second = load_excel_data(workbook, 'Feuil1')
+
+    assert len(calls) == 1
+    assert len(list(cache_dir.iterdir())) == 1
+    pd.testing.assert_frame_equal(second, first)
+
+
+@pytest.mark.parametrize('change', ['mtime', 'size'])
+def test_excel_cache_invalidated_when_workbook_changes(excel_cache, raw_df, change):
+    workbook, cache_dir, calls = excel_cache
+    load_excel_data(workbook, 'Feuil1')
+    old_entry = next(cache_dir.iterdir()).name
+
+    stat = os.stat(workbook)
+    if change == 'mtime':
+        os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    else:
+        _write_workbook(raw_df.iloc[:4], workbook)
+        os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert os.stat(workbook).st_size != stat.st_size
+    reloaded = load_excel_data(workbook, 'Feuil1')
+
+    assert len(calls) == 2
+    # L'ancienne copie est remplacée, pas conservée à côté de la nouvelle
+    entries = [entry.name for entry in cache_dir.iterdir()]
+    assert len(entries) == 1 and entries[0] != old_entry
+    assert len(reloaded) == (8 if change == 'mtime' else 4)
+
+
+def test_parallel_files_with_same_name_get_distinct_outputs(raw_df, tmp_path):
+    # Les processus de travail relisent la configuration : feuille configurée
+    sheet_name = data_processor.get('defaults.excel_sheet')
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'b').mkdir()
+    first = _write_workbook(raw_df, tmp_path / 'a' / 'donnees.xlsx', sheet_name)
+    second = _write_workbook(raw_df[raw_df['CODE_REGROUPEMENT'] == 'R2'],
+                             tmp_path / 'b' / 'donnees.xlsx', sheet_name)
+
+    outputs = nettoyer_plusieurs_fichiers([first, second, first], max_workers=2,
+                                          output_dir=str(tmp_path / 'processed'))
+
+    assert len(set(outputs)) == 3
+    contents = [open(path, 'rb').read().splitlines() for path in outputs]
+    assert contents[0] == contents[2]
+    assert len(contents[0]) == 5
+    assert len(contents[1]) == 2 and contents[1][1].startswith(b'"R2";')
+    assert not list((tmp_path / 'processed').glob('*.tmp'))
@@ -0,0 +1,120 @@
+"""
+Tests de la génération des attestations DOETH.
+"""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from docx import Document
+
+from src.data_processor import save_processed_data
+import src.document_generator as document_generator
+from src.document_generator import (_bounded_map, create_employee_table,
+                                    iter_attestations_doeth, read_processed_csv)
+
+
+@pytest.fixture
+def processed_df():
+    """Données telles que produites par le traitement (sommes avec bruit d'arrondi)."""
+    return pd.DataFrame({
+        'CODE_REGROUPEMENT': ['R1', 'R1', 'R2'],
+        'REGROUPEMENT': ['Regroupement A', 'Regroupement A', 'Regroupement B'],
+        'SIREN': ['012345678', '012345678', '987654321'],
+        'NIC': ['00012', '00012', '00034'],
+        'SIRET': ['01234567800012', '01234567800012', '98765432100034'],
+        'NOM_CLIENT': ['Client A', 'Client A', 'Client B'],
+        'CP_CLIENT': [35000, 35000, 44000],
+        'NOM': ['DUPONT', 'MARTIN', 'BERNARD'],
+        'PRENOM': ['Jean', 'Anne', ''],
+        'DATE_NAISSANCE': ['17/05/1980', '', '02/01/1990'],
+        'ANNEE': [2023, 2023, 2023],
+        'QUALIFICATION': ['Employé', 'Cadre', 'Ouvrier'],
+        'ETP_MAJORE': [1, 1, 1],
+        'ETP_ANNUEL': [0.25 + 0.35, 0.5 + 0.1, 1.0],
+        'NB_HEURES': [100.1 + 23.72 + 1e-13, 0.1 + 0.2, 151.67],
+        'NOUVEAU_GROUPE': pd.array([1, 0, 1], dtype='int8'),
+        'FIN_GROUPE': pd.array([0, 1, 1], dtype='int8'),
+    })
+
+
+def _table_text(df: pd.DataFrame) -> list:
+    doc = Document()
+    create_employee_table(doc, df)
+    return [[cell.text for cell in row.cells] for row in doc.tables[0].rows]
+
+
+def test_employee_table_hides_rounding_noise(processed_df):
+    rows = _table_text(processed_df)
+    assert [row[5:7] for row in rows[1:4]] == [
+        ['1.0', '123.82'], ['1.0', '0.3'], ['1.0', '151.67']]
+
+
+def test_binary_copy_and_csv_give_identical_tables(processed_df, tmp_path):
+    pytest.importorskip('pyarrow')
+    csv_path = str(tmp_path / 'processed.csv')
+    save_processed_data(processed_df, csv_path)
+    sidecar = csv_path + '.feather'
+    assert os.path.exists(sidecar)
+
+    from_sidecar = read_processed_csv(csv_path)
+    # Copie binaire plus ancienne que le CSV : relecture du CSV
+    os.utime(sidecar, (0, 0))
+    from_csv = read_processed_csv(csv_path)
+
+    pd.testing.assert_series_equal(from_sidecar.dtypes, from_csv.dtypes)
+    assert _table_text(from_sidecar) == _table_text(from_csv)
+    assert _table_text(from_csv) == _table_text(processed_df)
+
+
+def _generate(df: pd.DataFrame, output_folder: Path, monkeypatch, workers: int) -> list:
+    config_get = document_generator.get
+    monkeypatch.setattr(
+        document_generator, 'get',
+        lambda key, default=None: workers if key == 'defaults.parallel_workers' else config_get(key, default))
+    logger = logging.getLogger('test_publipostage')
+    return list(iter_attestations_doeth('', str(output_folder), logger, df=df))
+
+
+def _document_text(path: str) -> list:
+    doc = Document(path)
+    return [p.text for p in doc.paragraphs] + [
+        cell.text for table in doc.tables for row in table.rows for cell in row.cells]
+
+
+def test_parallel_generation_matches_sequential(processed_df, tmp_path, monkeypatch, caplog):
+    sequential = _generate(processed_df, tmp_path / 'sequentiel', monkeypatch, workers=1)
+    with caplog.at_level(logging.INFO):
+        parallel = _generate(processed_df, tmp_path / 'parallele', monkeypatch, workers=2)
+
+    # Même ordre (un lot de fichiers par SIRET) et même contenu
+    assert [[Path(f).name for f in files] for files in parallel] == \
+        [[Path(f).name for f in files] for files in sequential]
+    assert len(parallel) == 2
+    for parallel_files, sequential_files in zip(parallel, sequential):
+        for parallel_file, sequential_file in zip(parallel_files, sequential_files):
+            assert _document_text(parallel_file) == _document_text(sequential_file)
+
+    # Les messages des processus de travail sont retransmis au logger d'origine
+    worker_records = [r for r in caplog.records
+                      if r.name == 'test_publipostage' and r.process != os.getpid()]
+    assert any('98765432100034' in r.getMessage() for r in worker_records)
+
+
+def test_bounded_map_limits_pending_tasks():
+    in_flight, results = [], []
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args):
+            # Tâches soumises dont le résultat n'a pas encore été rendu
+            in_flight.append(len(in_flight) - len(results) + 1)
+            return super().submit(fn, *args)
+
+    with CountingExecutor(max_workers=2) as executor:
+        for value in _bounded_map(executor, lambda value: value * 10, range(10), window=3):
+            results.append(value)
+
+    assert results == [value * 10 for value in range(10)]
+    assert max(in_flight) == 3